@@ -23,13 +23,13 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.c
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_diff,
     remove_empties,
-    search_obj_in_list,
     to_list,
 )
 
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.facts import Facts
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
     flatten_dict,
+    index_obj_in_list,
     is_ipv4_address,
     prefix_to_address_wildcard,
 )
@@ -157,9 +157,10 @@ class Acls(ConfigBase):
             # list of dictionaries to the respective
             # _state_* methods we are passing the want
             # and have dictionaries per AFI
+            have_afis = index_obj_in_list(have, key="afi")
             for item in want:
                 afi = item["afi"]
-                obj_in_have = search_obj_in_list(afi, have, key="afi") or {}
+                obj_in_have = have_afis.get(afi) or {}
 
                 if state == "merged" or self.state == "rendered":
                     commands.extend(
@@ -184,32 +185,22 @@ class Acls(ConfigBase):
                   to the desired configuration
         """
         commands = []
+        have_acls = index_obj_in_list(have.get("acls", []))
 
         for want_acl in want["acls"]:
-            have_acl = search_obj_in_list(want_acl["name"], have.get("acls", [])) or {}
+            have_acl = have_acls.get(want_acl["name"]) or {}
             acl_updates = []
 
-            for have_ace in have_acl.get("aces", []):
-                want_ace = (
-                    search_obj_in_list(
-                        have_ace["sequence"],
-                        want_acl["aces"],
-                        key="sequence",
-                    )
-                    or {}
-                )
-                if not want_ace:
-                    acl_updates.append("no {0}".format(have_ace["sequence"]))
+            if have_acl.get("aces"):
+                want_aces = index_obj_in_list(want_acl["aces"], key="sequence")
+                for have_ace in have_acl["aces"]:
+                    want_ace = want_aces.get(have_ace["sequence"]) or {}
+                    if not want_ace:
+                        acl_updates.append("no {0}".format(have_ace["sequence"]))
 
+            have_aces = index_obj_in_list(have_acl.get("aces", []), key="sequence")
             for want_ace in want_acl.get("aces", []):
-                have_ace = (
-                    search_obj_in_list(
-                        want_ace.get("sequence"),
-                        have_acl.get("aces", []),
-                        key="sequence",
-                    )
-                    or {}
-                )
+                have_ace = have_aces.get(want_ace.get("sequence")) or {}
                 set_cmd = self._set_commands(want_ace, have_ace)
                 if set_cmd:
                     acl_updates.append(set_cmd)
@@ -237,8 +228,9 @@ class Acls(ConfigBase):
 
         # Remove extraneous AFI that are present in config but not
         # specified in `want`
+        want_afis = index_obj_in_list(want, key="afi")
         for have_afi in have:
-            want_afi = search_obj_in_list(have_afi["afi"], want, key="afi") or {}
+            want_afi = want_afis.get(have_afi["afi"]) or {}
             if not want_afi:
                 for acl in have_afi.get("acls", []):
                     commands.append(
@@ -251,18 +243,14 @@ class Acls(ConfigBase):
         # First we remove the extraneous ACLs from the AFIs that
         # are present both in `want` and in `have` and then
         # we call `_state_replaced` to update the ACEs within those ACLs
+        have_afis = index_obj_in_list(have, key="afi")
         for want_afi in want:
             want_afi = remove_empties(want_afi)
-            have_afi = search_obj_in_list(want_afi["afi"], have, key="afi") or {}
+            have_afi = have_afis.get(want_afi["afi"]) or {}
             if have_afi:
+                want_acls = index_obj_in_list(want_afi.get("acls", []))
                 for have_acl in have_afi.get("acls", []):
-                    want_acl = (
-                        search_obj_in_list(
-                            have_acl["name"],
-                            want_afi.get("acls", []),
-                        )
-                        or {}
-                    )
+                    want_acl = want_acls.get(have_acl["name"]) or {}
                     if not want_acl:
                         commands.append(
                             "no {0} access-list {1}".format(
@@ -286,19 +274,14 @@ class Acls(ConfigBase):
         if not have:
             have = {}
 
+        have_acls = index_obj_in_list(have.get("acls", {}))
         for want_acl in want["acls"]:
-            have_acl = search_obj_in_list(want_acl["name"], have.get("acls", {})) or {}
+            have_acl = have_acls.get(want_acl["name"]) or {}
 
             acl_updates = []
+            have_aces = index_obj_in_list(have_acl.get("aces", []), key="sequence")
             for want_ace in want_acl["aces"]:
-                have_ace = (
-                    search_obj_in_list(
-                        want_ace.get("sequence"),
-                        have_acl.get("aces", []),
-                        key="sequence",
-                    )
-                    or {}
-                )
+                have_ace = have_aces.get(want_ace.get("sequence")) or {}
                 set_cmd = self._set_commands(want_ace, have_ace)
                 if set_cmd:
                     acl_updates.append(set_cmd)
@@ -327,9 +310,10 @@ class Acls(ConfigBase):
         if not want:
             want = [{"afi": "ipv4"}, {"afi": "ipv6"}]
 
+        have_afis = index_obj_in_list(have, key="afi")
         for item in want:
             item = remove_empties(item)
-            have_item = search_obj_in_list(item["afi"], have, key="afi") or {}
+            have_item = have_afis.get(item["afi"]) or {}
             if "acls" not in item:
                 if have_item:
                     for acl in have_item["acls"]:
@@ -340,14 +324,9 @@ class Acls(ConfigBase):
                             ),
                         )
             else:
+                have_acls = index_obj_in_list(have_item.get("acls", []))
                 for want_acl in item["acls"]:
-                    have_acl = (
-                        search_obj_in_list(
-                            want_acl["name"],
-                            have_item.get("acls", []),
-                        )
-                        or {}
-                    )
+                    have_acl = have_acls.get(want_acl["name"]) or {}
                     if have_acl:
                         commands.append(
                             "no {0} access-list {1}".format(
@@ -27,6 +27,7 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.ut
     add_command_to_config_list,
     dict_to_set,
     filter_dict_having_none_value,
+    index_obj_in_list,
     normalize_interface,
     remove_command_from_config_list,
     remove_duplicate_interface,
@@ -161,12 +162,11 @@ class L3_Interfaces(ConfigBase):
         """
         commands = []
 
+        have_intfs = index_obj_in_list(have)
         for interface in want:
             interface["name"] = normalize_interface(interface["name"])
-            for each in have:
-                if each["name"] == interface["name"]:
-                    break
-            else:
+            each = have_intfs.get(interface["name"])
+            if not each:
                 commands.extend(self._set_config(interface, dict(), module))
                 continue
             have_dict = filter_dict_having_none_value(interface, each)
@@ -224,15 +224,14 @@ class L3_Interfaces(ConfigBase):
         """
         commands = []
 
+        have_intfs = index_obj_in_list(have)
         for interface in want:
             interface["name"] = normalize_interface(interface["name"])
             if self.state == "rendered":
                 commands.extend(self._set_config(interface, dict(), module))
             else:
-                for each in have:
-                    if each["name"] == interface["name"]:
-                        break
-                else:
+                each = have_intfs.get(interface["name"])
+                if not each:
                     commands.extend(
                         self._set_config(interface, dict(), module),
                     )
@@ -23,7 +23,6 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.c
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_diff,
     remove_empties,
-    search_obj_in_list,
     to_list,
 )
 
@@ -31,6 +30,7 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.fa
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
     dict_delete,
     flatten_dict,
+    index_obj_in_list,
     pad_commands,
 )
 
@@ -162,16 +162,18 @@ class Lacp_interfaces(ConfigBase):
                         ),
                     )
             else:
+                have_intfs = index_obj_in_list(have)
                 for item in want:
-                    obj_in_have = search_obj_in_list(item["name"], have)
+                    obj_in_have = have_intfs.get(item["name"])
                     commands.extend(
                         Lacp_interfaces._state_deleted(item, obj_in_have),
                     )
 
         else:
+            have_intfs = index_obj_in_list(have)
             for item in want:
                 name = item["name"]
-                obj_in_have = search_obj_in_list(name, have)
+                obj_in_have = have_intfs.get(name)
 
                 if state in ("merged", "rendered"):
                     commands.extend(
@@ -219,8 +221,9 @@ class Lacp_interfaces(ConfigBase):
                   to the desired configuration
         """
         commands = []
+        want_intfs = index_obj_in_list(want)
         for intf in have:
-            intf_in_want = search_obj_in_list(intf["name"], want)
+            intf_in_want = want_intfs.get(intf["name"])
             if not intf_in_want:
                 commands.extend(
                     Lacp_interfaces._state_deleted(
@@ -229,8 +232,9 @@ class Lacp_interfaces(ConfigBase):
                     ),
                 )
 
+        have_intfs = index_obj_in_list(have)
         for intf in want:
-            intf_in_have = search_obj_in_list(intf["name"], have)
+            intf_in_have = have_intfs.get(intf["name"])
             commands.extend(
                 Lacp_interfaces._state_replaced(intf, intf_in_have),
             )
@@ -25,7 +25,6 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     dict_diff,
     param_list_to_dict,
     remove_empties,
-    search_obj_in_list,
     to_list,
 )
 
@@ -36,6 +35,7 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.ut
     dict_delete,
     diff_list_of_dicts,
     flatten_dict,
+    index_obj_in_list,
     normalize_interface,
     pad_commands,
 )
@@ -177,9 +177,10 @@ class Lag_interfaces(ConfigBase):
             # list of dictionaries to the respective
             # _state_* methods we are passing the want
             # and have dictionaries per interface
+            have_intfs = index_obj_in_list(have)
             for item in want:
                 name = item["name"]
-                obj_in_have = search_obj_in_list(name, have)
+                obj_in_have = have_intfs.get(name)
 
                 if state in ("merged", "rendered"):
                     commands.extend(self._state_merged(item, obj_in_have))
@@ -218,13 +219,15 @@ class Lag_interfaces(ConfigBase):
                   to the desired configuration
         """
         commands = []
+        want_intfs = index_obj_in_list(want)
         for have_intf in have:
-            intf_in_want = search_obj_in_list(have_intf["name"], want)
+            intf_in_want = want_intfs.get(have_intf["name"])
             if not intf_in_want:
                 commands.extend(self._purge_attribs(have_intf))
 
+        have_intfs = index_obj_in_list(have)
         for intf in want:
-            intf_in_have = search_obj_in_list(intf["name"], have)
+            intf_in_have = have_intfs.get(intf["name"])
             commands.extend(self._state_replaced(intf, intf_in_have))
 
         return commands
@@ -258,9 +261,10 @@ class Lag_interfaces(ConfigBase):
             for item in have:
                 commands.extend(self._purge_attribs(intf=item))
         else:
+            have_intfs = index_obj_in_list(have)
             for item in want:
                 name = item["name"]
-                obj_in_have = search_obj_in_list(name, have)
+                obj_in_have = have_intfs.get(name)
                 if not obj_in_have:
                     self._module.fail_json(
                         msg=("interface {0} does not exist".format(name)),
@@ -23,7 +23,6 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.c
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_diff,
     remove_empties,
-    search_obj_in_list,
     to_list,
 )
 
@@ -31,6 +30,7 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.fa
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
     dict_delete,
     flatten_dict,
+    index_obj_in_list,
     pad_commands,
 )
 
@@ -157,14 +157,16 @@ class Lldp_interfaces(ConfigBase):
                         self._state_deleted({"name": intf["name"]}, intf),
                     )
             else:
+                have_intfs = index_obj_in_list(have)
                 for item in want:
-                    obj_in_have = search_obj_in_list(item["name"], have)
+                    obj_in_have = have_intfs.get(item["name"])
                     commands.extend(self._state_deleted(item, obj_in_have))
 
         else:
+            have_intfs = index_obj_in_list(have)
             for item in want:
                 name = item["name"]
-                obj_in_have = search_obj_in_list(name, have)
+                obj_in_have = have_intfs.get(name)
 
                 if state in ("merged", "rendered"):
                     commands.extend(self._state_merged(item, obj_in_have))
@@ -207,15 +209,17 @@ class Lldp_interfaces(ConfigBase):
         """
         commands = []
 
+        want_intfs = index_obj_in_list(want)
         for intf in have:
-            intf_in_want = search_obj_in_list(intf["name"], want)
+            intf_in_want = want_intfs.get(intf["name"])
             if not intf_in_want:
                 commands.extend(
                     self._state_deleted({"name": intf["name"]}, intf),
                 )
 
+        have_intfs = index_obj_in_list(have)
         for intf in want:
-            intf_in_have = search_obj_in_list(intf["name"], have)
+            intf_in_have = have_intfs.get(intf["name"])
             commands.extend(self._state_replaced(intf, intf_in_have))
 
         return commands
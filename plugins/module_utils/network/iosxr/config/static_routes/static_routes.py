@@ -24,11 +24,13 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     dict_diff,
     dict_merge,
     remove_empties,
-    search_obj_in_list,
     to_list,
 )
 
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.facts import Facts
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    index_obj_in_list,
+)
 
 
 class Static_routes(ConfigBase):
@@ -155,8 +157,9 @@ class Static_routes(ConfigBase):
                     return "no router static"
 
             else:
+                have_vrfs = self._index_vrfs(have)
                 for w_item in want:
-                    obj_in_have = self._find_vrf(w_item, have)
+                    obj_in_have = self._find_vrf(w_item, have_vrfs)
                     if obj_in_have:
                         commands.extend(
                             self._state_deleted(
@@ -166,8 +169,9 @@ class Static_routes(ConfigBase):
                         )
 
         else:
+            have_vrfs = self._index_vrfs(have)
             for w_item in want:
-                obj_in_have = self._find_vrf(w_item, have)
+                obj_in_have = self._find_vrf(w_item, have_vrfs)
                 if state == "merged" or self.state == "rendered":
                     commands.extend(
                         self._state_merged(
@@ -207,15 +211,9 @@ class Static_routes(ConfigBase):
                 or {}
             )
             update_commands = []
+            have_routes = index_obj_in_list(have_afi.get("routes", []), key="dest")
             for want_route in want_afi.get("routes", []):
-                have_route = (
-                    search_obj_in_list(
-                        want_route["dest"],
-                        have_afi.get("routes", []),
-                        key="dest",
-                    )
-                    or {}
-                )
+                have_route = have_routes.get(want_route["dest"]) or {}
 
                 rotated_have_next_hops = self.rotate_next_hops(
                     have_route.get("next_hops", {}),
@@ -282,8 +280,9 @@ class Static_routes(ConfigBase):
         """
         commands = []
 
+        want_vrfs = self._index_vrfs(want)
         for h_item in have:
-            w_item = self._find_vrf(h_item, want)
+            w_item = self._find_vrf(h_item, want_vrfs)
             # Delete all the top-level keys (VRFs/Global Route Entry) that are
             # not specified in want.
             if not w_item:
@@ -294,8 +293,9 @@ class Static_routes(ConfigBase):
                     self._state_replaced(remove_empties(w_item), h_item),
                 )
 
+        have_vrfs = self._index_vrfs(have)
         for w_item in want:
-            h_item = self._find_vrf(w_item, have)
+            h_item = self._find_vrf(w_item, have_vrfs)
             commands.extend(
                 self._state_replaced(remove_empties(w_item), h_item),
             )
@@ -321,15 +321,9 @@ class Static_routes(ConfigBase):
             )
 
             update_commands = []
+            have_routes = index_obj_in_list(have_afi.get("routes", []), key="dest")
             for want_route in want_afi.get("routes", []):
-                have_route = (
-                    search_obj_in_list(
-                        want_route["dest"],
-                        have_afi.get("routes", []),
-                        key="dest",
-                    )
-                    or {}
-                )
+                have_route = have_routes.get(want_route["dest"]) or {}
 
                 # convert the next_hops list of dictionaries to dictionary of
                 # dictionaries with (`dest_vrf`, `forward_router_address`, `interface`) tuple
@@ -403,15 +397,9 @@ class Static_routes(ConfigBase):
                 ),
             )
         else:
+            want_routes = index_obj_in_list(want_afi.get("routes", []), key="dest")
             for have_route in have_afi.get("routes", []):
-                want_route = (
-                    search_obj_in_list(
-                        have_route["dest"],
-                        want_afi.get("routes", []),
-                        key="dest",
-                    )
-                    or {}
-                )
+                want_route = want_routes.get(have_route["dest"]) or {}
 
                 rotated_want_next_hops = self.rotate_next_hops(
                     want_route.get("next_hops", {}),
@@ -472,25 +460,31 @@ class Static_routes(ConfigBase):
 
         return commands
 
+    def _index_vrfs(self, entries):
+        """This method indexes the items in `entries`
+            by VRF, the global route entry is indexed
+            under None.
+
+        :rtype: A dict
+        :returns: the objs in `entries` by VRF
+        """
+        index = {}
+        for x in entries:
+            vrf = x.get("vrf")
+            if vrf:
+                index.setdefault(vrf, x)
+            elif "vrf" not in remove_empties(x):
+                index.setdefault(None, x)
+        return index
+
     def _find_vrf(self, item, entries):
-        """This method iterates through the items
-            in `entries` and returns the object that
-            matches `item`.
+        """This method returns the object in the
+            indexed `entries` that matches `item`.
 
         :rtype: A dict
         :returns: the obj in `entries` that matches `item`
         """
-        obj = {}
-        afi = item.get("vrf")
-
-        if afi:
-            obj = search_obj_in_list(afi, entries, key="vrf") or {}
-        else:
-            for x in entries:
-                if "vrf" not in remove_empties(x):
-                    obj = x
-                    break
-        return obj
+        return entries.get(item.get("vrf") or None) or {}
 
     def find_af_context(self, want_af_context, have_address_families):
         """This method iterates through the have AFs
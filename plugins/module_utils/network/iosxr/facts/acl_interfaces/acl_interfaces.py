@@ -25,6 +25,12 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.acl_interfaces import (
     Acl_interfacesTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    get_interface_sections,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.validation import (
+    validate_config,
+)
 
 
 class Acl_interfacesFacts(object):
@@ -59,7 +65,7 @@ class Acl_interfacesFacts(object):
         if not data:
             data = self.get_config(connection)
 
-        config_parser = Acl_interfacesTemplate(lines=data.splitlines())
+        config_parser = Acl_interfacesTemplate(lines=get_interface_sections(data).lines)
         entry = sorted(
             list(config_parser.parse().values()),
             key=lambda k, sk="name": k[sk],
@@ -73,7 +79,7 @@ class Acl_interfacesFacts(object):
 
         ansible_facts["ansible_network_resources"].pop("acl_interfaces", None)
         facts = {"acl_interfaces": []}
-        params = utils.validate_config(self.argument_spec, {"config": entry})
+        params = validate_config(self.argument_spec, {"config": entry})
         for cfg in params["config"]:
             facts["acl_interfaces"].append(utils.remove_empties(cfg))
 
@@ -27,8 +27,12 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
     AclsArgs,
 )
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    FactSkeleton,
     isipaddress,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.validation import (
+    validate_config,
+)
 
 
 PROTOCOL_OPTIONS = {
@@ -212,7 +216,7 @@ class AclsFacts(object):
         facts = {}
 
         facts["acls"] = []
-        params = utils.validate_config(self.argument_spec, {"config": objs})
+        params = validate_config(self.argument_spec, {"config": objs})
         for cfg in params["config"]:
             facts["acls"].append(utils.remove_empties(cfg))
 
@@ -230,7 +234,7 @@ class AclsFacts(object):
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
+        config = FactSkeleton(spec)
         config["acls"] = []
 
         for item in conf:
@@ -242,7 +246,7 @@ class AclsFacts(object):
                     acl["aces"].append(self._render_ace(ace))
             config["acls"].append(acl)
 
-        return utils.remove_empties(config)
+        return config.remove_empties()
 
     def _render_ace(self, ace):
         """
@@ -26,7 +26,10 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templ
     Bgp_address_familyTemplate,
 )
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
-    flatten_config,
+    get_bgp_config,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.validation import (
+    validate_config,
 )
 
 
@@ -63,10 +66,9 @@ class Bgp_address_familyFacts(object):
         if not data:
             data = self.get_config(connection)
 
-        nb_data = flatten_config(data, "neighbor")
-        data = flatten_config(nb_data, "vrf")
+        bgp_config = get_bgp_config(data)
         # parse native config using the Bgp_global template
-        bgp_global_parser = Bgp_address_familyTemplate(lines=data.splitlines())
+        bgp_global_parser = Bgp_address_familyTemplate(lines=bgp_config.address_family_lines)
         objs = bgp_global_parser.parse()
 
         af = objs.get("address_family")
@@ -81,7 +83,7 @@ class Bgp_address_familyFacts(object):
         )
 
         params = utils.remove_empties(
-            utils.validate_config(self.argument_spec, {"config": objs}),
+            validate_config(self.argument_spec, {"config": objs}),
         )
 
         facts["bgp_address_family"] = params.get("config", {})
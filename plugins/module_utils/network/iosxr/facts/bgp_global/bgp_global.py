@@ -26,7 +26,7 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templ
     Bgp_globalTemplate,
 )
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
-    flatten_config,
+    get_bgp_config,
 )
 
 
@@ -62,27 +62,15 @@ class Bgp_globalFacts(object):
         """
         facts = {}
         objs = []
-        bgp_global_config = []
         if not data:
             data = self.get_config(connection)
-        neighbor_data = flatten_config(data, "neighbor")
-        rpki_server_data = flatten_config(neighbor_data, "rpki server")
-        data = flatten_config(rpki_server_data, "bgp confederation peers")
 
-        # remove address_family configs from bgp_global
-
-        start = False
-        for bgp_line in data.splitlines():
-            if "address-family" in bgp_line:
-                start = True
-            if not start:
-                bgp_global_config.append(bgp_line)
-            if start and "!" in bgp_line:
-                start = False
+        # address_family configs are already removed from the bgp_global lines
+        bgp_config = get_bgp_config(data)
 
         # parse native config using the Bgp_global template
         bgp_global_parser = Bgp_globalTemplate(
-            lines=bgp_global_config,
+            lines=bgp_config.global_lines,
             module=self._module,
         )
         objs = bgp_global_parser.parse()
@@ -26,7 +26,10 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templ
     Bgp_neighbor_address_familyTemplate,
 )
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
-    flatten_config,
+    get_bgp_config,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.validation import (
+    validate_config,
 )
 
 
@@ -62,11 +65,10 @@ class Bgp_neighbor_address_familyFacts(object):
         objs = []
         if not data:
             data = self.get_config(connection)
-        nbr_data = flatten_config(data, "neighbor")
-        data = flatten_config(nbr_data, "vrf")
+        bgp_config = get_bgp_config(data)
         # parse native config using the Bgp_global template
         bgp_global_parser = Bgp_neighbor_address_familyTemplate(
-            lines=data.splitlines(),
+            lines=bgp_config.address_family_lines,
         )
         objs = bgp_global_parser.parse()
 
@@ -88,7 +90,7 @@ class Bgp_neighbor_address_familyFacts(object):
         )
 
         params = utils.remove_empties(
-            utils.validate_config(self.argument_spec, {"config": objs}),
+            validate_config(self.argument_spec, {"config": objs}),
         )
 
         facts["bgp_neighbor_address_family"] = params.get("config", {})
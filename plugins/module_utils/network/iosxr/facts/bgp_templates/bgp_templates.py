@@ -24,7 +24,7 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templ
     Bgp_templatesTemplate,
 )
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
-    flatten_config,
+    get_bgp_config,
 )
 
 
@@ -53,9 +53,12 @@ class Bgp_templatesFacts(object):
 
         if not data:
             data = self.get_config(connection)
-        data = flatten_config(data, "neighbor-group")
+        bgp_config = get_bgp_config(data)
         # parse native config using the Bgp_templates template
-        bgp_templates_parser = Bgp_templatesTemplate(lines=data.splitlines(), module=self._module)
+        bgp_templates_parser = Bgp_templatesTemplate(
+            lines=bgp_config.template_lines,
+            module=self._module,
+        )
         objs = bgp_templates_parser.parse()
         if objs:
             objs["neighbor"] = self._post_parse(objs).get(
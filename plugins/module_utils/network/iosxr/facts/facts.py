@@ -15,96 +15,22 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
+from collections.abc import Mapping
+
+from ansible.module_utils.common.text.converters import to_text
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.facts.facts import (
     FactsBase,
 )
 
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.acl_interfaces.acl_interfaces import (
-    Acl_interfacesFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.acls.acls import (
-    AclsFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.bgp_address_family.bgp_address_family import (
-    Bgp_address_familyFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.bgp_global.bgp_global import (
-    Bgp_globalFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.bgp_neighbor_address_family.bgp_neighbor_address_family import (
-    Bgp_neighbor_address_familyFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.bgp_templates.bgp_templates import (
-    Bgp_templatesFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.hostname.hostname import (
-    HostnameFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.interfaces.interfaces import (
-    InterfacesFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.l2_interfaces.l2_interfaces import (
-    L2_InterfacesFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.l3_interfaces.l3_interfaces import (
-    L3_InterfacesFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.lacp.lacp import (
-    LacpFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.lacp_interfaces.lacp_interfaces import (
-    Lacp_interfacesFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.lag_interfaces.lag_interfaces import (
-    Lag_interfacesFacts,
-)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.legacy.base import (
     Config,
     Default,
     Hardware,
     Interfaces,
 )
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.lldp_global.lldp_global import (
-    Lldp_globalFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.lldp_interfaces.lldp_interfaces import (
-    Lldp_interfacesFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.logging_global.logging_global import (
-    Logging_globalFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.ntp_global.ntp_global import (
-    Ntp_globalFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.ospf_interfaces.ospf_interfaces import (
-    Ospf_interfacesFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.ospfv2.ospfv2 import (
-    Ospfv2Facts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.ospfv3.ospfv3 import (
-    Ospfv3Facts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.prefix_lists.prefix_lists import (
-    Prefix_listsFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.route_maps.route_maps import (
-    Route_mapsFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.snmp_server.snmp_server import (
-    Snmp_serverFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.static_routes.static_routes import (
-    Static_routesFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.vrf_address_family.vrf_address_family import (
-    Vrf_address_familyFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.vrf_global.vrf_global import (
-    Vrf_globalFacts,
-)
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.vrf_interfaces.vrf_interfaces import (
-    Vrf_interfacesFacts,
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    get_config_section,
+    split_config_sections,
 )
 
 
@@ -114,35 +40,317 @@ FACT_LEGACY_SUBSETS = dict(
     interfaces=Interfaces,
     config=Config,
 )
-FACT_RESOURCE_SUBSETS = dict(
-    lacp=LacpFacts,
-    lacp_interfaces=Lacp_interfacesFacts,
-    lldp_global=Lldp_globalFacts,
-    lldp_interfaces=Lldp_interfacesFacts,
-    interfaces=InterfacesFacts,
-    l2_interfaces=L2_InterfacesFacts,
-    lag_interfaces=Lag_interfacesFacts,
-    l3_interfaces=L3_InterfacesFacts,
-    acl_interfaces=Acl_interfacesFacts,
-    acls=AclsFacts,
-    static_routes=Static_routesFacts,
-    ospfv2=Ospfv2Facts,
-    ospfv3=Ospfv3Facts,
-    ospf_interfaces=Ospf_interfacesFacts,
-    bgp_neighbor_address_family=Bgp_neighbor_address_familyFacts,
-    bgp_address_family=Bgp_address_familyFacts,
-    bgp_global=Bgp_globalFacts,
-    prefix_lists=Prefix_listsFacts,
-    logging_global=Logging_globalFacts,
-    ntp_global=Ntp_globalFacts,
-    snmp_server=Snmp_serverFacts,
-    hostname=HostnameFacts,
-    bgp_templates=Bgp_templatesFacts,
-    vrf_address_family=Vrf_address_familyFacts,
-    vrf_global=Vrf_globalFacts,
-    route_maps=Route_mapsFacts,
-    vrf_interfaces=Vrf_interfacesFacts,
+
+
+class FactClasses(Mapping):
+    """Maps each resource to its facts class, the class and with it
+    the resource argspec and templates are only imported when the
+    resource is looked up, so that a module gathering one resource
+    does not load all of them
+    """
+
+    def __init__(self, loaders):
+        self._loaders = loaders
+        self._classes = {}
+
+    def __getitem__(self, key):
+        if key not in self._classes:
+            self._classes[key] = self._loaders[key]()
+        return self._classes[key]
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self):
+        return len(self._loaders)
+
+
+# the loaders import their facts class explicitly, so that the
+# imports are still found when the module payload is built
+def _lacp():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.lacp.lacp import (
+        LacpFacts,
+    )
+
+    return LacpFacts
+
+
+def _lacp_interfaces():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.lacp_interfaces.lacp_interfaces import (
+        Lacp_interfacesFacts,
+    )
+
+    return Lacp_interfacesFacts
+
+
+def _lldp_global():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.lldp_global.lldp_global import (
+        Lldp_globalFacts,
+    )
+
+    return Lldp_globalFacts
+
+
+def _lldp_interfaces():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.lldp_interfaces.lldp_interfaces import (
+        Lldp_interfacesFacts,
+    )
+
+    return Lldp_interfacesFacts
+
+
+def _interfaces():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.interfaces.interfaces import (
+        InterfacesFacts,
+    )
+
+    return InterfacesFacts
+
+
+def _l2_interfaces():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.l2_interfaces.l2_interfaces import (
+        L2_InterfacesFacts,
+    )
+
+    return L2_InterfacesFacts
+
+
+def _lag_interfaces():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.lag_interfaces.lag_interfaces import (
+        Lag_interfacesFacts,
+    )
+
+    return Lag_interfacesFacts
+
+
+def _l3_interfaces():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.l3_interfaces.l3_interfaces import (
+        L3_InterfacesFacts,
+    )
+
+    return L3_InterfacesFacts
+
+
+def _acl_interfaces():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.acl_interfaces.acl_interfaces import (
+        Acl_interfacesFacts,
+    )
+
+    return Acl_interfacesFacts
+
+
+def _acls():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.acls.acls import (
+        AclsFacts,
+    )
+
+    return AclsFacts
+
+
+def _static_routes():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.static_routes.static_routes import (
+        Static_routesFacts,
+    )
+
+    return Static_routesFacts
+
+
+def _ospfv2():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.ospfv2.ospfv2 import (
+        Ospfv2Facts,
+    )
+
+    return Ospfv2Facts
+
+
+def _ospfv3():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.ospfv3.ospfv3 import (
+        Ospfv3Facts,
+    )
+
+    return Ospfv3Facts
+
+
+def _ospf_interfaces():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.ospf_interfaces.ospf_interfaces import (
+        Ospf_interfacesFacts,
+    )
+
+    return Ospf_interfacesFacts
+
+
+def _bgp_neighbor_address_family():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.bgp_neighbor_address_family.bgp_neighbor_address_family import (
+        Bgp_neighbor_address_familyFacts,
+    )
+
+    return Bgp_neighbor_address_familyFacts
+
+
+def _bgp_address_family():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.bgp_address_family.bgp_address_family import (
+        Bgp_address_familyFacts,
+    )
+
+    return Bgp_address_familyFacts
+
+
+def _bgp_global():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.bgp_global.bgp_global import (
+        Bgp_globalFacts,
+    )
+
+    return Bgp_globalFacts
+
+
+def _prefix_lists():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.prefix_lists.prefix_lists import (
+        Prefix_listsFacts,
+    )
+
+    return Prefix_listsFacts
+
+
+def _logging_global():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.logging_global.logging_global import (
+        Logging_globalFacts,
+    )
+
+    return Logging_globalFacts
+
+
+def _ntp_global():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.ntp_global.ntp_global import (
+        Ntp_globalFacts,
+    )
+
+    return Ntp_globalFacts
+
+
+def _snmp_server():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.snmp_server.snmp_server import (
+        Snmp_serverFacts,
+    )
+
+    return Snmp_serverFacts
+
+
+def _hostname():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.hostname.hostname import (
+        HostnameFacts,
+    )
+
+    return HostnameFacts
+
+
+def _bgp_templates():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.bgp_templates.bgp_templates import (
+        Bgp_templatesFacts,
+    )
+
+    return Bgp_templatesFacts
+
+
+def _vrf_address_family():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.vrf_address_family.vrf_address_family import (
+        Vrf_address_familyFacts,
+    )
+
+    return Vrf_address_familyFacts
+
+
+def _vrf_global():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.vrf_global.vrf_global import (
+        Vrf_globalFacts,
+    )
+
+    return Vrf_globalFacts
+
+
+def _route_maps():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.route_maps.route_maps import (
+        Route_mapsFacts,
+    )
+
+    return Route_mapsFacts
+
+
+def _vrf_interfaces():
+    from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.vrf_interfaces.vrf_interfaces import (
+        Vrf_interfacesFacts,
+    )
+
+    return Vrf_interfacesFacts
+
+
+FACT_RESOURCE_SUBSETS = FactClasses(
+    dict(
+        lacp=_lacp,
+        lacp_interfaces=_lacp_interfaces,
+        lldp_global=_lldp_global,
+        lldp_interfaces=_lldp_interfaces,
+        interfaces=_interfaces,
+        l2_interfaces=_l2_interfaces,
+        lag_interfaces=_lag_interfaces,
+        l3_interfaces=_l3_interfaces,
+        acl_interfaces=_acl_interfaces,
+        acls=_acls,
+        static_routes=_static_routes,
+        ospfv2=_ospfv2,
+        ospfv3=_ospfv3,
+        ospf_interfaces=_ospf_interfaces,
+        bgp_neighbor_address_family=_bgp_neighbor_address_family,
+        bgp_address_family=_bgp_address_family,
+        bgp_global=_bgp_global,
+        prefix_lists=_prefix_lists,
+        logging_global=_logging_global,
+        ntp_global=_ntp_global,
+        snmp_server=_snmp_server,
+        hostname=_hostname,
+        bgp_templates=_bgp_templates,
+        vrf_address_family=_vrf_address_family,
+        vrf_global=_vrf_global,
+        route_maps=_route_maps,
+        vrf_interfaces=_vrf_interfaces,
+    ),
+)
+# top-level running-config sections each resource is parsed from,
+# resources not listed here (acls) collect their own data
+FACT_RESOURCE_SECTIONS = dict(
+    lacp=("lacp",),
+    lacp_interfaces=("interface",),
+    lldp_global=("lldp",),
+    lldp_interfaces=("interface",),
+    interfaces=("interface",),
+    l2_interfaces=("interface",),
+    lag_interfaces=("interface",),
+    l3_interfaces=("interface",),
+    acl_interfaces=("interface",),
+    static_routes=("router static",),
+    ospfv2=("router ospf",),
+    ospfv3=("router ospfv3",),
+    ospf_interfaces=("router ospf", "router ospfv3"),
+    bgp_neighbor_address_family=("router bgp",),
+    bgp_address_family=("router bgp",),
+    bgp_global=("router bgp",),
+    prefix_lists=("ipv4 prefix-list", "ipv6 prefix-list"),
+    logging_global=("logging",),
+    ntp_global=("ntp",),
+    snmp_server=("snmp-server",),
+    hostname=("hostname",),
+    bgp_templates=("router bgp",),
+    vrf_address_family=("vrf",),
+    vrf_global=("vrf",),
+    route_maps=("route-policy",),
+    vrf_interfaces=("interface",),
 )
+# resources read from the YANG JSON config when connected over gRPC,
+# which has no running-config text to parse, the YANG renderers of a
+# resource must produce the same facts as its running-config parser
+FACT_RESOURCE_YANG = frozenset(("interfaces", "static_routes"))
+# stands in for an unconfigured section so that
+# collectors do not fall back to fetching it themselves
+EMPTY_SECTION = "!"
 
 
 class Facts(FactsBase):
@@ -182,3 +390,69 @@ class Facts(FactsBase):
             )
 
         return self.ansible_facts, self._warnings
+
+    def get_network_resources_facts(
+        self,
+        facts_resource_obj_map,
+        resource_facts_type=None,
+        data=None,
+    ):
+        """Collect the resource facts, sharing one running-config
+        snapshot between collectors when more than one is gathered
+
+        :param facts_resource_obj_map: map of resource name to facts class
+        :param resource_facts_type: List of resource fact types
+        :param data: previously collected conf
+        """
+        if not resource_facts_type:
+            resource_facts_type = self._gather_network_resources
+
+        restorun_subsets = self.gen_runable(
+            resource_facts_type,
+            frozenset(facts_resource_obj_map.keys()),
+            resource_facts=True,
+        )
+        if not restorun_subsets:
+            return
+
+        self.ansible_facts["ansible_net_gather_network_resources"] = list(restorun_subsets)
+        instances = list()
+        for key in restorun_subsets:
+            fact_cls_obj = facts_resource_obj_map.get(key)
+            if fact_cls_obj:
+                instances.append((key, fact_cls_obj(self._module)))
+            else:
+                self._warnings.extend(
+                    ["network resource fact gathering for '%s' is not supported" % key],
+                )
+
+        grpc = bool(not data and self._connection and self.is_grpc())
+        sections = None
+        if not data and self._connection and not grpc:
+            shared = [key for key, inst in instances if key in FACT_RESOURCE_SECTIONS]
+            if len(shared) > 1:
+                try:
+                    sections = split_config_sections(self._connection.get_config())
+                except Exception as exc:
+                    self._module.fail_json(msg=to_text(exc))
+
+        slices = {}
+        for key, inst in instances:
+            inst_data = data
+            if sections is not None and key in FACT_RESOURCE_SECTIONS:
+                keys = FACT_RESOURCE_SECTIONS[key]
+                if keys not in slices:
+                    slices[keys] = get_config_section(sections, keys) or EMPTY_SECTION
+                inst_data = slices[keys]
+            try:
+                if grpc and key in FACT_RESOURCE_YANG:
+                    inst.populate_yang_facts(self._connection, self.ansible_facts)
+                else:
+                    inst.populate_facts(self._connection, self.ansible_facts, inst_data)
+            except Exception as exc:
+                self._module.fail_json(msg=to_text(exc))
+
+    def is_grpc(self):
+        """True if the module is connected with ansible.netcommon.grpc"""
+        capabilities = getattr(self._module, "_capabilities", None) or {}
+        return capabilities.get("network_api") == "ansible.netcommon.grpc"
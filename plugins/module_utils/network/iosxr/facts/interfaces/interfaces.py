@@ -24,8 +24,20 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
     InterfacesArgs,
 )
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    FactSkeleton,
+    get_interface_sections,
     get_interface_type,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.validation import (
+    validate_config,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.yang import (
+    get_yang_config,
+    yang_list,
+)
+
+
+YANG_SECTION = {"Cisco-IOS-XR-ifmgr-cfg:interface-configurations": [None]}
 
 
 class InterfacesFacts(object):
@@ -61,17 +73,44 @@ class InterfacesFacts(object):
             data = self.get_config(connection)
 
         # operate on a collection of resource x
-        config = ("\n" + data).split("\ninterface ")
+        config = get_interface_sections(data)
         for conf in config:
             if conf:
                 obj = self.render_config(self.generated_spec, conf)
                 if obj:
                     objs.append(obj)
 
+        return self.update_facts(ansible_facts, objs)
+
+    def populate_yang_facts(self, connection, ansible_facts, data=None):
+        """Populate the facts for interfaces from the YANG JSON config
+        :param connection: the device connection, over gRPC
+        :param ansible_facts: Facts dictionary
+        :param data: previously collected YANG JSON config
+        :rtype: dictionary
+        :returns: facts
+        """
+        if not data:
+            data = get_yang_config(connection, YANG_SECTION)
+
+        objs = []
+        for conf in yang_list(
+            data,
+            "Cisco-IOS-XR-ifmgr-cfg:interface-configurations",
+            "interface-configuration",
+        ):
+            obj = self.render_yang(self.generated_spec, conf)
+            if obj:
+                objs.append(obj)
+
+        return self.update_facts(ansible_facts, objs)
+
+    def update_facts(self, ansible_facts, objs):
+        """Validates the rendered objs and updates the facts with them"""
         facts = {}
         if objs:
             facts["interfaces"] = []
-            params = utils.validate_config(
+            params = validate_config(
                 self.argument_spec,
                 {"config": objs},
             )
@@ -90,7 +129,7 @@ class InterfacesFacts(object):
         :returns: The generated config
         """
 
-        config = deepcopy(spec)
+        config = FactSkeleton(spec)
         match = re.search(r"^(\S+)", conf)
         if match:
             intf = match.group(1)
@@ -112,4 +151,34 @@ class InterfacesFacts(object):
             enabled = utils.parse_conf_cmd_arg(conf, "shutdown", False)
             config["enabled"] = enabled if enabled is not None else True
 
-            return utils.remove_empties(config)
+            return config.remove_empties()
+
+    def render_yang(self, spec, conf):
+        """
+        Render an interface-configuration of the YANG JSON config
+        in the same structure as render_config()
+        :param spec: The facts tree, generated from the argspec
+        :param conf: The interface-configuration
+        :rtype: dictionary
+        :returns: The generated config
+        """
+        intf = conf.get("interface-name")
+        if not intf or get_interface_type(intf) == "unknown":
+            return {}
+
+        config = FactSkeleton(spec)
+        config["name"] = intf
+        config["description"] = conf.get("description")
+        ethernet = conf.get("Cisco-IOS-XR-drivers-media-eth-cfg:ethernet") or {}
+        if ethernet.get("speed"):
+            config["speed"] = int(ethernet["speed"])
+        mtus = yang_list(conf, "mtus", "mtu")
+        if mtus:
+            # the mtu of the interface type itself, not of a protocol
+            owner = re.match(r"[A-Za-z-]*", intf).group(0)
+            mtu = next((item for item in mtus if item.get("owner") == owner), mtus[0])
+            config["mtu"] = int(mtu["mtu"])
+        config["duplex"] = ethernet.get("duplex")
+        config["enabled"] = "shutdown" not in conf
+
+        return config.remove_empties()
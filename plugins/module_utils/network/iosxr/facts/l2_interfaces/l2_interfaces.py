@@ -26,9 +26,14 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 )
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import get_os_version
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    FactSkeleton,
     Version,
+    get_interface_sections,
     get_interface_type,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.validation import (
+    validate_config,
+)
 
 
 class L2_InterfacesFacts(object):
@@ -64,7 +69,7 @@ class L2_InterfacesFacts(object):
             data = self.get_config(connection)
 
         # operate on a collection of resource x
-        config = ("\n" + data).split("\ninterface ")
+        config = get_interface_sections(data)
         for conf in config:
             if conf:
                 obj = self.render_config(self.generated_spec, conf)
@@ -73,7 +78,7 @@ class L2_InterfacesFacts(object):
         facts = {}
         if objs:
             facts["l2_interfaces"] = []
-            params = utils.validate_config(
+            params = validate_config(
                 self.argument_spec,
                 {"config": objs},
             )
@@ -91,7 +96,7 @@ class L2_InterfacesFacts(object):
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
+        config = FactSkeleton(spec)
         match = re.search(r"^(\S+)", conf)
         if match:
             intf = match.group(1)
@@ -155,4 +160,4 @@ class L2_InterfacesFacts(object):
             if cpsv:
                 config["l2protocol"].append({"cpsv": cpsv})
 
-            return utils.remove_empties(config)
+            return config.remove_empties()
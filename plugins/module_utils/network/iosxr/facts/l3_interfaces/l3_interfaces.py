@@ -26,9 +26,14 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
     L3_InterfacesArgs,
 )
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    FactSkeleton,
+    get_interface_sections,
     get_interface_type,
     netmask_to_cidr,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.validation import (
+    validate_config,
+)
 
 
 class L3_InterfacesFacts(object):
@@ -64,7 +69,7 @@ class L3_InterfacesFacts(object):
         if not data:
             data = self.get_config(connection)
         # operate on a collection of resource x
-        config = ("\n" + data).split("\ninterface ")
+        config = get_interface_sections(data)
         for conf in config:
             if conf:
                 obj = self.render_config(self.generated_spec, conf)
@@ -74,7 +79,7 @@ class L3_InterfacesFacts(object):
 
         if objs:
             facts["l3_interfaces"] = []
-            params = utils.validate_config(
+            params = validate_config(
                 self.argument_spec,
                 {"config": objs},
             )
@@ -92,7 +97,7 @@ class L3_InterfacesFacts(object):
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
+        config = FactSkeleton(spec)
         match = re.search(r"^(\S+)", conf)
         if match:
             intf = match.group(1)
@@ -174,9 +179,6 @@ class L3_InterfacesFacts(object):
                 re.M,
             )
             if flow_monitor_lines:
-                if "flow" not in config or not config["flow"]:
-                    config["flow"] = {}
-
                 flow_monitor_data = {}
                 for line in flow_monitor_lines:
                     protocol, monitor, sampler, direction = line
@@ -210,7 +212,7 @@ class L3_InterfacesFacts(object):
                         "direction": direction,
                     }
 
-            return utils.remove_empties(config)
+            return config.remove_empties()
 
     def format_ipv4(self, address):
         parts = address.split(" ")
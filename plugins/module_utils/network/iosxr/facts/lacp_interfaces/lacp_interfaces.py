@@ -25,6 +25,13 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.lacp_interfaces.lacp_interfaces import (
     Lacp_interfacesArgs,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    FactSkeleton,
+    get_interface_sections,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.validation import (
+    validate_config,
+)
 
 
 class Lacp_interfacesFacts(object):
@@ -58,7 +65,7 @@ class Lacp_interfacesFacts(object):
 
         if not data:
             data = self.get_config(connection)
-        interfaces = ("\n" + data).split("\ninterface ")
+        interfaces = get_interface_sections(data)
 
         objs = []
         for interface in interfaces:
@@ -70,7 +77,7 @@ class Lacp_interfacesFacts(object):
         facts = {}
         if objs:
             facts["lacp_interfaces"] = []
-            params = utils.validate_config(
+            params = validate_config(
                 self.argument_spec,
                 {"config": objs},
             )
@@ -90,7 +97,7 @@ class Lacp_interfacesFacts(object):
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
+        config = FactSkeleton(spec)
 
         match = re.search(
             r"(GigabitEthernet|Bundle-Ether|TenGigE|FortyGigE|HundredGigE)(\S+)",
@@ -110,10 +117,10 @@ class Lacp_interfacesFacts(object):
             for key, value in temp.items():
                 config[key] = utils.parse_conf_arg(conf, value)
 
-            for key in config["system"].keys():
+            for key in spec["system"]:
                 config["system"][key] = utils.parse_conf_arg(
                     conf,
                     "lacp system {0}".format(key),
                 )
 
-        return utils.remove_empties(config)
+        return config.remove_empties()
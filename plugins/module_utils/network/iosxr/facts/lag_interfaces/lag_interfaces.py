@@ -25,6 +25,13 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.lag_interfaces.lag_interfaces import (
     Lag_interfacesArgs,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    FactSkeleton,
+    get_interface_sections,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.validation import (
+    validate_config,
+)
 
 
 class Lag_interfacesFacts(object):
@@ -58,7 +65,8 @@ class Lag_interfacesFacts(object):
 
         if not data:
             data = self.get_config(connection)
-        interfaces = ("\n" + data).split("\ninterface ")
+        interfaces = get_interface_sections(data)
+        members = self.parse_members(interfaces)
 
         objs = []
 
@@ -67,7 +75,7 @@ class Lag_interfacesFacts(object):
                 obj = self.render_config(
                     self.generated_spec,
                     interface,
-                    interfaces,
+                    members,
                 )
                 if obj:
                     objs.append(obj)
@@ -76,24 +84,25 @@ class Lag_interfacesFacts(object):
         facts = {}
 
         facts["lag_interfaces"] = []
-        params = utils.validate_config(self.argument_spec, {"config": objs})
+        params = validate_config(self.argument_spec, {"config": objs})
         for cfg in params["config"]:
             facts["lag_interfaces"].append(utils.remove_empties(cfg))
 
         ansible_facts["ansible_network_resources"].update(facts)
         return ansible_facts
 
-    def render_config(self, spec, conf, data):
+    def render_config(self, spec, conf, members):
         """
         Render config as dictionary structure and delete keys
         from spec for null values
 
         :param spec: The facts tree, generated from the argspec
         :param conf: The configuration
+        :param members: The member interfaces by bundle id
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
+        config = FactSkeleton(spec)
         match = re.search(r"(Bundle-Ether)(\d+)", conf, re.M)
         if match:
             config["name"] = match.group(1) + match.group(2)
@@ -110,19 +119,18 @@ class Lag_interfacesFacts(object):
                 conf,
                 "bundle minimum-active links",
             )
-            config["members"] = self.parse_members(match.group(2), data)
+            config["members"] = members.get(match.group(2))
 
-        return utils.remove_empties(config)
+        return config.remove_empties()
 
-    def parse_members(self, bundle_id, interfaces):
+    def parse_members(self, interfaces):
         """
-        Renders a list of member interfaces for every bundle
-        present in running-config.
+        Renders the member interfaces of every bundle
+        present in running-config in a single pass.
 
-        :param bundle_id: The Bundle-Ether ID fetched from running-config
         :param interfaces: Data of all interfaces present in running-config
-        :rtype: list
-        :returns: A list of member interfaces
+        :rtype: dict
+        :returns: A list of member interfaces by bundle id
         """
 
         def _parse_interface(name):
@@ -131,7 +139,7 @@ class Lag_interfacesFacts(object):
             else:
                 return name.split()[0]
 
-        members = []
+        members = {}
         for interface in interfaces:
             if not interface.startswith("Bu"):
                 match = re.search(
@@ -140,12 +148,11 @@ class Lag_interfacesFacts(object):
                     re.M,
                 )
                 if match:
-                    if bundle_id == match.group(1):
-                        members.append(
-                            {
-                                "member": _parse_interface(interface),
-                                "mode": match.group(2),
-                            },
-                        )
+                    members.setdefault(match.group(1), []).append(
+                        {
+                            "member": _parse_interface(interface),
+                            "mode": match.group(2),
+                        },
+                    )
 
         return members
@@ -23,6 +23,9 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.lldp_global.lldp_global import (
     Lldp_globalArgs,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.validation import (
+    validate_config,
+)
 
 
 class Lldp_globalFacts(object):
@@ -65,7 +68,7 @@ class Lldp_globalFacts(object):
         ansible_facts["ansible_network_resources"].pop("lldp_global", None)
         facts = {}
 
-        params = utils.validate_config(self.argument_spec, {"config": obj})
+        params = validate_config(self.argument_spec, {"config": obj})
         facts["lldp_global"] = utils.remove_empties(params["config"])
 
         ansible_facts["ansible_network_resources"].update(facts)
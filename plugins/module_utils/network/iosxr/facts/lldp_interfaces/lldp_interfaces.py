@@ -25,6 +25,13 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.lldp_interfaces.lldp_interfaces import (
     Lldp_interfacesArgs,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    FactSkeleton,
+    get_interface_sections,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.validation import (
+    validate_config,
+)
 
 
 class Lldp_interfacesFacts(object):
@@ -58,7 +65,7 @@ class Lldp_interfacesFacts(object):
 
         if not data:
             data = self.get_config(connection)
-        interfaces = ("\n" + data).split("\ninterface ")
+        interfaces = get_interface_sections(data)
 
         objs = []
         for interface in interfaces:
@@ -71,7 +78,7 @@ class Lldp_interfacesFacts(object):
 
         if objs:
             facts["lldp_interfaces"] = []
-            params = utils.validate_config(
+            params = validate_config(
                 self.argument_spec,
                 {"config": objs},
             )
@@ -91,7 +98,7 @@ class Lldp_interfacesFacts(object):
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
+        config = FactSkeleton(spec)
 
         match = re.search(
             r"(GigabitEthernet|Bundle-Ether|TenGigE|FortyGigE|HundredGigE)(\S+)",
@@ -108,4 +115,4 @@ class Lldp_interfacesFacts(object):
                 if x in conf:
                     config["destination"]["mac_address"] = x
 
-        return utils.remove_empties(config)
+        return config.remove_empties()
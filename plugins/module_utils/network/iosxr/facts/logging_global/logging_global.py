@@ -66,8 +66,7 @@ class Logging_globalFacts(object):
             "logging console discriminator",
         ]
 
-        for x in flatten_context_list:
-            data = flatten_config(data, x)
+        data = flatten_config(data, flatten_context_list)
         # parse native config using the Logging_global template
         logging_global_parser = Logging_globalTemplate(
             lines=data.splitlines(),
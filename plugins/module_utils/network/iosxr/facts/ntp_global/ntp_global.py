@@ -56,8 +56,7 @@ class Ntp_globalFacts(object):
 
         flatten_context_list = ["interface", "ntp"]
 
-        for x in flatten_context_list:
-            data = flatten_config(data, x)
+        data = flatten_config(data, flatten_context_list)
         # parse native config using the Ntp_global template
         ntp_global_parser = Ntp_globalTemplate(
             lines=data.splitlines(),
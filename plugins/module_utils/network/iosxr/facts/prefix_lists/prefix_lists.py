@@ -24,6 +24,13 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.prefix_lists import (
     Prefix_listsTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    get_config_section,
+    split_config_sections,
+)
+
+
+PREFIX_LIST_SECTIONS = ("ipv4 prefix-list", "ipv6 prefix-list")
 
 
 class Prefix_listsFacts(object):
@@ -34,7 +41,10 @@ class Prefix_listsFacts(object):
         self.argument_spec = Prefix_listsArgs.argument_spec
 
     def get_config(self, connection):
-        return connection.get("show running-config")
+        return "\n".join(
+            connection.get("show running-config {0}".format(section))
+            for section in PREFIX_LIST_SECTIONS
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """Populate the facts for Prefix_lists network resource
@@ -51,6 +61,10 @@ class Prefix_listsFacts(object):
         if not data:
             data = self.get_config(connection)
 
+        # only prefix-list sections are handed to the parser, whether data
+        # is a full running-config or an already sliced section
+        data = get_config_section(split_config_sections(data), PREFIX_LIST_SECTIONS)
+
         # parse native config using the Prefix_lists template
         prefix_lists_parser = Prefix_listsTemplate(
             lines=data.splitlines(),
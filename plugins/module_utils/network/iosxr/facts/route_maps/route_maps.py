@@ -33,11 +33,36 @@ class Route_mapsFacts(object):
         self._module = module
         self.argument_spec = Route_mapsArgs.argument_spec
 
-    def get_policynames(self, connection):
-        return connection.get("show running-config | include route-policy")
+    def get_config(self, connection):
+        return connection.get("show running-config route-policy")
 
-    def get_policydata(self, connection, name):
-        return connection.get(f"show running-config route-policy {name}")
+    def split_policies(self, data):
+        """Splits route-policy configuration into individual policies,
+        each policy runs from its route-policy line to its end-policy line
+
+        :param data: route-policy configuration
+
+        :rtype: list
+        :returns: (name, policy data) tuples in config order
+        """
+        policies = []
+        name, lines = None, []
+
+        for line in data.splitlines():
+            if line.startswith("route-policy "):
+                if name is not None:
+                    policies.append((name, "\n".join(lines)))
+                name, lines = line.split(" ", 1)[1], []
+            if name is None:
+                continue
+            lines.append(line)
+            if line.startswith("end-policy"):
+                policies.append((name, "\n".join(lines)))
+                name = None
+
+        if name is not None:
+            policies.append((name, "\n".join(lines)))
+        return policies
 
     def parse_condition(self, condition):
         if condition.startswith("if "):
@@ -217,35 +242,17 @@ class Route_mapsFacts(object):
         """
         facts = {}
         objs = []
-        policy_names = []
-        mock_data = False
 
         if not data:
-            # gets policy names as there is no good way to get all policy data at once,
-            # other than slicing running-config
-            data = self.get_policynames(connection=connection)
-        else:
-            mock_data = True  # for states like parsed to work
+            # all policies are fetched at once and sliced locally
+            data = self.get_config(connection)
 
         # parse native config using the Route_maps template
         route_maps_parser = Route_mapsTemplate(lines=[], module=self._module)
 
-        for name in data.splitlines():  # generate a list of policy names
-            if name.startswith("route-policy "):
-                policy_names.append(name.split(" ", 1)[1])
-
-        if mock_data:  # only for states like parsed
-            data_for_parsed = data.split("end-policy\n!")
-
-        for idx, policy in enumerate(policy_names):
-            if mock_data:
-                # we enumerate the split data as the name and policy details are on the same sequence
-                policy_data = data_for_parsed[idx]
-            else:
-                # we send the name of the policy and the policy data is fetched for each name, one costly operation
-                policy_data = self.get_policydata(connection=connection, name=policy)
+        for name, policy_data in self.split_policies(data):
             # the list of policy facts is created as individual route-policy information is converted to facts
-            objs.append(self.get_policy_config(policy_data=policy_data, name=policy))
+            objs.append(self.get_policy_config(policy_data=policy_data, name=name))
 
         ansible_facts["ansible_network_resources"].pop("route_maps", None)
 
@@ -64,8 +64,7 @@ class Snmp_serverFacts(object):
             "snmp-server correlator ruleset",
         ]
 
-        for x in flatten_context_list:
-            data = flatten_config(data, x)
+        data = flatten_config(data, flatten_context_list)
         # parse native config using the Snmp_server template
         snmp_server_parser = Snmp_serverTemplate(
             lines=data.splitlines(),
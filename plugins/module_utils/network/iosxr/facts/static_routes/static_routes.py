@@ -25,6 +25,63 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common i
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.static_routes.static_routes import (
     Static_routesArgs,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    FactSkeleton,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.validation import (
+    validate_config,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.yang import (
+    check_yang_leaves,
+    get_yang_config,
+    yang_get,
+    yang_list,
+)
+
+
+YANG_SECTION = {"Cisco-IOS-XR-ip-static-cfg:router-static": [None]}
+
+# address families in the running-config order
+YANG_ADDRESS_FAMILIES = (
+    ("ipv4", "unicast"),
+    ("ipv6", "unicast"),
+    ("ipv4", "multicast"),
+    ("ipv6", "multicast"),
+)
+
+# the next hop lists of a vrf-next-hop-table, one per kind of exit point
+YANG_NEXT_HOPS = (
+    "vrf-next-hop-interface-name",
+    "vrf-next-hop-interface-name-next-hop-address",
+    "vrf-next-hop-next-hop-address",
+)
+
+# next_hops attributes and the next hop leaves they are read from, the
+# metric leaf is the distance metric of the path (1-254) the running-config
+# shows without a keyword, load-metric is the value of the metric keyword
+YANG_NEXT_HOP_ATTRIBUTES = (
+    ("forward_router_address", "next-hop-address"),
+    ("interface", "interface-name"),
+    ("admin_distance", "metric"),
+    ("tag", "tag"),
+    ("tunnel_id", "tunnel-id"),
+    ("metric", "load-metric"),
+    ("description", "description"),
+    ("track", "object-name"),
+    ("vrflabel", "vrf-lable"),
+)
+
+# next hop leaves the running-config parser does not model either
+YANG_NEXT_HOP_IGNORED = (
+    "bfd-fast-detect",
+    "minimum-interval",
+    "detect-multiplier",
+    "permanent",
+)
+
+YANG_NEXT_HOP_LEAVES = frozenset(
+    [leaf for attrib, leaf in YANG_NEXT_HOP_ATTRIBUTES] + list(YANG_NEXT_HOP_IGNORED),
+)
 
 
 class Static_routesFacts(object):
@@ -66,11 +123,38 @@ class Static_routesFacts(object):
                 if obj:
                     objs.append(obj)
 
+        return self.update_facts(ansible_facts, objs)
+
+    def populate_yang_facts(self, connection, ansible_facts, data=None):
+        """Populate the facts for static_routes from the YANG JSON config
+        :param connection: the device connection, over gRPC
+        :param ansible_facts: Facts dictionary
+        :param data: previously collected YANG JSON config
+        :rtype: dictionary
+        :returns: facts
+        """
+        if not data:
+            data = get_yang_config(connection, YANG_SECTION)
+
+        objs = []
+        router_static = yang_get(data, "Cisco-IOS-XR-ip-static-cfg:router-static") or {}
+        vrfs = [router_static.get("default-vrf")]
+        vrfs.extend(yang_list(router_static, "vrfs", "vrf"))
+        for entry in vrfs:
+            if entry:
+                obj = self.render_yang(self.generated_spec, entry)
+                if obj:
+                    objs.append(obj)
+
+        return self.update_facts(ansible_facts, objs)
+
+    def update_facts(self, ansible_facts, objs):
+        """Validates the rendered objs and updates the facts with them"""
         ansible_facts["ansible_network_resources"].pop("static_routes", None)
         facts = {}
 
         facts["static_routes"] = []
-        params = utils.validate_config(self.argument_spec, {"config": objs})
+        params = validate_config(self.argument_spec, {"config": objs})
         for cfg in params["config"]:
             facts["static_routes"].append(utils.remove_empties(cfg))
 
@@ -87,7 +171,7 @@ class Static_routesFacts(object):
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
+        config = FactSkeleton(spec)
         entry_list = conf.split(" address-family")
         config["address_families"] = []
 
@@ -99,14 +183,18 @@ class Static_routesFacts(object):
             address_family = {"routes": []}
             address_family["afi"], address_family["safi"] = self.parse_af(item)
 
-            destinations = re.findall(r"((?:\S+)/(?:\d+)) (?:.*)", item, re.M)
-            for dest in set(destinations):
+            # group the route entries by destination in a single pass
+            destinations = {}
+            for match in re.finditer(r"((?:\S+)/(?:\d+)) (.*)", item):
+                dest = match.group(1)
+                entries = destinations.setdefault(dest, [])
+                if match.group(2):
+                    entries.append(match.group(0))
+
+            for dest, cfg in destinations.items():
                 route = {"next_hops": []}
                 route["dest"] = dest
 
-                regex = r"%s .+$" % dest
-                cfg = re.findall(regex, item, re.M)
-
                 for route_entry in cfg:
                     exit_point = {}
                     exit_point["forward_router_address"] = self.parse_faddr(
@@ -134,13 +222,85 @@ class Static_routesFacts(object):
                     route["next_hops"].append(exit_point)
 
                 routes.append(route)
-                address_family["routes"] = sorted(
-                    routes,
-                    key=lambda i: i["dest"],
-                )
+            address_family["routes"] = sorted(
+                routes,
+                key=lambda i: i["dest"],
+            )
             config["address_families"].append(address_family)
 
-        return utils.remove_empties(config)
+        return config.remove_empties()
+
+    def render_yang(self, spec, conf):
+        """
+        Render a vrf of the YANG JSON router-static config
+        in the same structure as render_config()
+        :param spec: The facts tree, generated from the argspec
+        :param conf: The default-vrf or vrf entry
+        :rtype: dictionary
+        :returns: The generated config
+        """
+        config = FactSkeleton(spec)
+        config["address_families"] = []
+        config["vrf"] = conf.get("vrf-name")
+
+        for afi, safi in YANG_ADDRESS_FAMILIES:
+            prefixes = yang_list(
+                conf,
+                "address-family",
+                "vrfipv%s" % afi[-1],
+                "vrf-%s" % safi,
+                "vrf-prefixes",
+                "vrf-prefix",
+            )
+            if not prefixes:
+                continue
+            routes = []
+            for prefix in prefixes:
+                check_yang_leaves(prefix, ("prefix", "prefix-length", "vrf-route"), "vrf-prefix")
+                check_yang_leaves(
+                    prefix.get("vrf-route") or {},
+                    ("vrf-next-hop-table", "vrf-recurses"),
+                    "vrf-route",
+                )
+                route = {"dest": "%s/%s" % (prefix["prefix"], prefix["prefix-length"])}
+                next_hops = self.parse_yang_next_hops(
+                    yang_get(prefix, "vrf-route", "vrf-next-hop-table"),
+                )
+                for recurse in yang_list(prefix, "vrf-route", "vrf-recurses", "vrf-recurse"):
+                    next_hops.extend(self.parse_yang_next_hops(recurse, recurse.get("vrf-name")))
+                # the next hop lists are split by kind, order them
+                # by exit point like the running-config does
+                route["next_hops"] = sorted(
+                    next_hops,
+                    key=lambda i: tuple(
+                        i[k] or "" for k in ("dest_vrf", "interface", "forward_router_address")
+                    ),
+                )
+                routes.append(route)
+            config["address_families"].append(
+                {
+                    "afi": afi,
+                    "safi": safi,
+                    "routes": sorted(routes, key=lambda i: i["dest"]),
+                },
+            )
+
+        return config.remove_empties()
+
+    def parse_yang_next_hops(self, table, dest_vrf=None):
+        next_hops = []
+        if table:
+            known = YANG_NEXT_HOPS + (("vrf-name",) if dest_vrf else ())
+            check_yang_leaves(table, known, "vrf-recurse" if dest_vrf else "vrf-next-hop-table")
+        for key in YANG_NEXT_HOPS:
+            for next_hop in yang_list(table, key):
+                check_yang_leaves(next_hop, YANG_NEXT_HOP_LEAVES, key)
+                exit_point = {}
+                for attrib, leaf in YANG_NEXT_HOP_ATTRIBUTES:
+                    exit_point[attrib] = next_hop.get(leaf)
+                exit_point["dest_vrf"] = dest_vrf
+                next_hops.append(exit_point)
+        return next_hops
 
     def parse_af(self, item):
         match = re.search(r"(?:\s*)(\w+)(?:\s*)(\w+)", item, re.M)
@@ -58,10 +58,7 @@ class Vrf_address_familyFacts(object):
         if not data:
             data = self.get_config(connection)
 
-        export_data = flatten_config(data, "export")
-        import_data = flatten_config(export_data, "import")
-        address_data = flatten_config(import_data, "address-family")
-        data = flatten_config(address_data, "vrf")
+        data = flatten_config(data, ["export", "import", "address-family", "vrf"])
 
         # parse native config using the Vrf_address_family template
         vrf_address_family_parser = Vrf_address_familyTemplate(
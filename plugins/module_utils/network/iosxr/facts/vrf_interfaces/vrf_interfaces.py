@@ -23,6 +23,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.vrf_interfaces import (
     Vrf_interfacesTemplate,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    get_interface_sections,
+)
 
 
 class Vrf_interfacesFacts(object):
@@ -52,7 +55,9 @@ class Vrf_interfacesFacts(object):
             data = self.get_device_data(connection)
 
         # parse native config using the Vrf_interfaces template
-        vrf_interfaces_parser = Vrf_interfacesTemplate(lines=data.splitlines(), module=self._module)
+        vrf_interfaces_parser = Vrf_interfacesTemplate(
+            lines=get_interface_sections(data).lines, module=self._module
+        )
         objs = list(vrf_interfaces_parser.parse().values())
 
         ansible_facts["ansible_network_resources"].pop("vrf_interfaces", None)
@@ -30,10 +30,11 @@ from __future__ import absolute_import, division, print_function
 
 
 __metaclass__ = type
+import hashlib
 import json
 import re
 
-from difflib import Differ
+from collections import OrderedDict
 
 from ansible.module_utils._text import to_bytes, to_text
 from ansible.module_utils.connection import Connection, ConnectionError
@@ -127,78 +128,140 @@ def get_capabilities(module):
     return module.capabilities
 
 
-def build_xml_subtree(container_ele, xmap, param=None, opcode=None):
-    sub_root = container_ele
-    meta_subtree = list()
-
-    for key, meta in xmap.items():
-        candidates = meta.get("xpath", "").split("/")
-        if container_ele.tag == candidates[-2]:
-            parent = container_ele
-        elif sub_root.tag == candidates[-2]:
-            parent = sub_root
-        else:
-            parent = sub_root.find(
-                ".//" + meta.get("xpath", "").split(sub_root.tag + "/", 1)[1].rsplit("/", 1)[0],
-            )
+class XmapStep(object):
+    """An xmap entry with its xpath, namespace and value source resolved"""
+
+    __slots__ = (
+        "tag",
+        "parent_tag",
+        "xpath",
+        "parent_xpath",
+        "find_paths",
+        "is_tag",
+        "nsmap",
+        "attrib",
+        "param",
+        "value",
+    )
+
+    def __init__(self, key, meta, opcode):
+        self.xpath = meta.get("xpath", "")
+        candidates = self.xpath.split("/")
+        self.tag = candidates[-1]
+        self.parent_tag = candidates[-2]
+        self.parent_xpath = self.xpath.rsplit("/", 1)[0]
+        # parent paths relative to the subtree root, by the root tag
+        self.find_paths = {}
+        self.is_tag = meta.get("tag", False) is True
+        self.nsmap = None
+        if meta.get("ns", False) is True:
+            self.nsmap = NS_DICT[key.upper() + "_NSMAP"]
+        self.attrib = None
+        if meta.get("attrib", None) is not None and opcode in ("delete", "merge"):
+            self.attrib = BASE_1_0 + meta.get("attrib")
+
+        self.param = self.value = None
+        param_key = key.split(":")
+        if param_key[0] == "a":
+            self.param = param_key[1]
+        elif param_key[0] == "m":
+            self.value = meta.get("value", None)
+
+    def find_path(self, root_tag):
+        path = self.find_paths.get(root_tag)
+        if path is None:
+            path = ".//" + self.xpath.split(root_tag + "/", 1)[1].rsplit("/", 1)[0]
+            self.find_paths[root_tag] = path
+        return path
+
+
+class XmapBuilder(object):
+    """An xmap compiled for an opcode, builds the subtree of each param"""
+
+    def __init__(self, xmap, opcode=None):
+        self.opcode = opcode
+        self.steps = [
+            XmapStep(key, meta, opcode)
+            for key, meta in xmap.items()
+            if (opcode in ("delete", "merge") and meta.get("operation", "unknown") == "edit")
+            or meta.get("operation", None) is None
+        ]
+
+    def build(self, container_ele, param=None):
+        container_tag = container_ele.tag
+        sub_root, root_tag = container_ele, container_tag
+        meta_subtree = list()
+        # the elements built under sub_root by their xpath, parents
+        # are looked up here before searching the subtree
+        built = {}
+
+        for step in self.steps:
+            if container_tag == step.parent_tag:
+                parent = container_ele
+            elif root_tag == step.parent_tag:
+                parent = sub_root
+            else:
+                parent = built.get(step.parent_xpath)
+                if parent is None:
+                    parent = sub_root.find(step.find_path(root_tag))
 
-        if (
-            opcode in ("delete", "merge") and meta.get("operation", "unknown") == "edit"
-        ) or meta.get("operation", None) is None:
-            if meta.get("tag", False) is True:
-                if parent.tag == container_ele.tag:
-                    if meta.get("ns", False) is True:
-                        child = etree.Element(candidates[-1], nsmap=NS_DICT[key.upper() + "_NSMAP"])
-                    else:
-                        child = etree.Element(candidates[-1])
+            if step.is_tag:
+                if parent.tag == container_tag:
+                    child = etree.Element(step.tag, nsmap=step.nsmap)
                     meta_subtree.append(child)
-                    sub_root = child
+                    sub_root, root_tag = child, step.tag
+                    built = {}
                 else:
-                    if meta.get("ns", False) is True:
-                        child = etree.SubElement(
-                            parent,
-                            candidates[-1],
-                            nsmap=NS_DICT[key.upper() + "_NSMAP"],
-                        )
-                    else:
-                        child = etree.SubElement(parent, candidates[-1])
-
-                if meta.get("attrib", None) is not None and opcode in ("delete", "merge"):
-                    child.set(BASE_1_0 + meta.get("attrib"), opcode)
+                    child = etree.SubElement(parent, step.tag, nsmap=step.nsmap)
+                    built.setdefault(step.xpath, child)
 
+                if step.attrib is not None:
+                    child.set(step.attrib, self.opcode)
                 continue
 
             text = None
-            param_key = key.split(":")
-            if param_key[0] == "a":
-                if param is not None and param.get(param_key[1], None) is not None:
-                    text = param.get(param_key[1])
-            elif param_key[0] == "m":
-                if meta.get("value", None) is not None:
-                    text = meta.get("value")
+            if step.param is not None:
+                if param is not None and param.get(step.param, None) is not None:
+                    text = param.get(step.param)
+            else:
+                text = step.value
 
             if text:
-                if meta.get("ns", False) is True:
-                    child = etree.SubElement(
-                        parent,
-                        candidates[-1],
-                        nsmap=NS_DICT[key.upper() + "_NSMAP"],
-                    )
-                else:
-                    child = etree.SubElement(parent, candidates[-1])
+                child = etree.SubElement(parent, step.tag, nsmap=step.nsmap)
                 child.text = text
+                built.setdefault(step.xpath, child)
 
-                if meta.get("attrib", None) is not None and opcode in ("delete", "merge"):
-                    child.set(BASE_1_0 + meta.get("attrib"), opcode)
+                if step.attrib is not None:
+                    child.set(step.attrib, self.opcode)
 
-    if len(meta_subtree) > 1:
-        for item in meta_subtree:
-            container_ele.append(item)
+        if len(meta_subtree) > 1:
+            for item in meta_subtree:
+                container_ele.append(item)
 
-    if sub_root == container_ele:
-        return None
-    else:
-        return sub_root
+        if sub_root is container_ele:
+            return None
+        else:
+            return sub_root
+
+
+_XMAP_BUILDERS = {}
+
+
+def compile_xmap(xmap, opcode=None):
+    """Returns the XmapBuilder of an xmap for opcode, compiled on first use
+
+    The builder is cached per xmap object and rebuilt if its entries change.
+    """
+    signature = tuple((key, tuple(sorted(meta.items()))) for key, meta in xmap.items())
+    cached = _XMAP_BUILDERS.get((id(xmap), opcode))
+    if cached is None or cached[0] is not xmap or cached[1] != signature:
+        cached = (xmap, signature, XmapBuilder(xmap, opcode))
+        _XMAP_BUILDERS[(id(xmap), opcode)] = cached
+    return cached[2]
+
+
+def build_xml_subtree(container_ele, xmap, param=None, opcode=None):
+    return compile_xmap(xmap, opcode).build(container_ele, param)
 
 
 def build_xml(container, xmap=None, params=None, opcode=None, namespace=None):
@@ -253,12 +316,13 @@ def build_xml(container, xmap=None, params=None, opcode=None, namespace=None):
     container_ele = etree.SubElement(root, container, nsmap=NS_DICT[namespace.upper() + "_NSMAP"])
 
     if xmap is not None:
+        builder = compile_xmap(xmap, opcode)
         if params is None:
-            build_xml_subtree(container_ele, xmap, opcode=opcode)
+            builder.build(container_ele)
         else:
             subtree_list = list()
             for param in to_list(params):
-                subtree_ele = build_xml_subtree(container_ele, xmap, param=param, opcode=opcode)
+                subtree_ele = builder.build(container_ele, param)
                 if subtree_ele is not None:
                     subtree_list.append(subtree_ele)
 
@@ -268,22 +332,40 @@ def build_xml(container, xmap=None, params=None, opcode=None, namespace=None):
     return etree.tostring(root, encoding="unicode")
 
 
-def etree_find(root, node):
-    try:
-        root = etree.fromstring(to_bytes(root))
-    except (ValueError, etree.XMLSyntaxError):
-        pass
+# the most recently parsed replies, by their text
+_PARSED_REPLIES = OrderedDict()
+_PARSED_REPLIES_SIZE = 4
 
-    return root.find(".//%s" % node.strip())
 
+def etree_parse(root):
+    """Returns the parsed element of an xml reply
+
+    Modules look up several nodes in the same reply, each reply is
+    parsed once and its tree shared between the lookups, so it must
+    not be modified. Elements are returned as they are.
+    """
+    if not isinstance(root, (str, bytes)):
+        return root
+    tree = _PARSED_REPLIES.get(root)
+    if tree is None:
+        try:
+            tree = etree.fromstring(to_bytes(root))
+        except (ValueError, etree.XMLSyntaxError):
+            return root
+        _PARSED_REPLIES[root] = tree
+        if len(_PARSED_REPLIES) > _PARSED_REPLIES_SIZE:
+            _PARSED_REPLIES.popitem(last=False)
+    else:
+        _PARSED_REPLIES.move_to_end(root)
+    return tree
 
-def etree_findall(root, node):
-    try:
-        root = etree.fromstring(to_bytes(root))
-    except (ValueError, etree.XMLSyntaxError):
-        pass
 
-    return root.findall(".//%s" % node.strip())
+def etree_find(root, node):
+    return etree_parse(root).find(".//%s" % node.strip())
+
+
+def etree_findall(root, node):
+    return etree_parse(root).findall(".//%s" % node.strip())
 
 
 def is_cliconf(module):
@@ -304,6 +386,136 @@ def is_netconf(module):
     return False
 
 
+def _config_children(ele):
+    """Groups the child elements of ele by tag, in document order"""
+    groups = {}
+    for child in ele:
+        if isinstance(child.tag, str):
+            groups.setdefault(child.tag, []).append(child)
+    return groups
+
+
+def _leading_leaves(ele):
+    """Returns the (tag, text) of the leaf children ele starts with,
+    YANG encodes the keys of a list entry first
+    """
+    leaves = []
+    for child in ele:
+        if not isinstance(child.tag, str):
+            continue
+        if len(child):
+            break
+        leaves.append((child.tag, (child.text or "").strip()))
+    return leaves
+
+
+def _config_keys(running, candidate):
+    """Keys the entries of a group of siblings with the same tag by the
+    fewest leading leaves that tell the entries of each tree apart,
+    by position if they do not
+    """
+    if len(running) < 2 and len(candidate) < 2:
+        return [()] * len(running), [()] * len(candidate)
+    leaves = [_leading_leaves(ele) for ele in running + candidate]
+    depth = max([len(item) for item in leaves] or [0])
+    split = len(running)
+    for count in range(depth + 1):
+        keys = [tuple(item[:count]) for item in leaves]
+        running_keys, candidate_keys = keys[:split], keys[split:]
+        if len(set(running_keys)) == len(running) and len(set(candidate_keys)) == len(candidate):
+            return running_keys, candidate_keys
+    return [(idx,) for idx in range(len(running))], [(idx,) for idx in range(len(candidate))]
+
+
+def _config_path(path, ele, key):
+    if key and isinstance(key[0], int):
+        predicates = "[%d]" % (key[0] + 1)
+    else:
+        predicates = "".join("[%s=%s]" % (etree.QName(tag).localname, text) for tag, text in key)
+    return "%s/%s%s" % (path, etree.QName(ele).localname, predicates)
+
+
+def _config_digests(root):
+    """Digests every subtree of root in a single bottom-up pass,
+    subtrees with the same tags, leaf texts and attributes
+    in the same order have the same digest
+    """
+    digests = {}
+    # children follow their parent in document order
+    for ele in reversed(list(root.iter())):
+        if not isinstance(ele.tag, str):
+            continue
+        digest = hashlib.sha1(to_bytes(ele.tag))
+        digest.update(b"\0" + to_bytes((ele.text or "").strip()))
+        for name, value in sorted(ele.attrib.items()):
+            digest.update(b"\0" + to_bytes(name) + b"=" + to_bytes(value))
+        for child in ele:
+            if isinstance(child.tag, str):
+                digest.update(digests[child])
+        digests[ele] = digest.digest()
+    return digests
+
+
+def iter_config_diff(running, candidate, path=""):
+    """Yields the changes between two config trees
+
+    The children of both elements are matched by tag and, for YANG list
+    entries, by their key leaves, so that entries moved around are not
+    reported. Subtrees that only exist in one of the trees are yielded
+    whole, leaves whose text differ are yielded from both trees.
+
+    :param running: the running config lxml element
+    :param candidate: the candidate config lxml element
+    :param path: the path of the elements, used in the yielded changes
+    :returns: ("-" | "+", path, element) tuples, for each changed element
+              the removed entries before the added or changed ones
+    """
+    digests = _config_digests(running)
+    digests.update(_config_digests(candidate))
+    if digests[running] == digests[candidate]:
+        return iter(())
+    return _iter_config_diff(running, candidate, path, digests)
+
+
+def _iter_config_diff(running, candidate, path, digests):
+    running_groups = _config_children(running)
+    candidate_groups = _config_children(candidate)
+
+    matches = []
+    for tag, candidate_group in candidate_groups.items():
+        running_group = running_groups.get(tag, [])
+        running_keys, candidate_keys = _config_keys(running_group, candidate_group)
+        running_entries = dict(zip(running_keys, running_group))
+        for key, ele in zip(candidate_keys, candidate_group):
+            matches.append((key, running_entries.pop(key, None), ele))
+        for key, ele in running_entries.items():
+            yield "-", _config_path(path, ele, key), ele
+    for tag, running_group in running_groups.items():
+        if tag not in candidate_groups:
+            for key, ele in zip(_config_keys(running_group, [])[0], running_group):
+                yield "-", _config_path(path, ele, key), ele
+
+    for key, running_ele, candidate_ele in matches:
+        if running_ele is None:
+            yield "+", _config_path(path, candidate_ele, key), candidate_ele
+            continue
+        # most of the tree is unchanged, compare whole subtrees
+        # by their digests before walking them
+        if digests[running_ele] == digests[candidate_ele]:
+            continue
+        ele_path = _config_path(path, candidate_ele, key)
+        if len(running_ele) or len(candidate_ele):
+            if not len(running_ele) or not len(candidate_ele):
+                yield "-", ele_path, running_ele
+                yield "+", ele_path, candidate_ele
+            else:
+                for change in _iter_config_diff(running_ele, candidate_ele, ele_path, digests):
+                    yield change
+        elif (running_ele.text or "").strip() != (candidate_ele.text or "").strip():
+            yield "-", ele_path, running_ele
+            yield "+", ele_path, candidate_ele
+
+
 def get_config_diff(module, running=None, candidate=None):
     conn = get_connection(module)
 
@@ -316,15 +528,16 @@ def get_config_diff(module, running=None, candidate=None):
     elif is_netconf(module):
         if running and candidate:
             # ignore rpc-reply root node and diff from data element onwards
-            running_data_ele = etree.fromstring(to_bytes(running.strip())).getchildren()[0]
-            candidate_data_ele = etree.fromstring(to_bytes(candidate.strip())).getchildren()[0]
-
-            running_data = to_text(etree.tostring(running_data_ele)).strip()
-            candidate_data = to_text(etree.tostring(candidate_data_ele)).strip()
-            if running_data != candidate_data:
-                d = Differ()
-                diff = list(d.compare(running_data.splitlines(), candidate_data.splitlines()))
-                return "\n".join(diff).strip()
+            running_data_ele = etree.fromstring(to_bytes(running.strip()))[0]
+            candidate_data_ele = etree.fromstring(to_bytes(candidate.strip()))[0]
+
+            diff = []
+            for op, path, ele in iter_config_diff(running_data_ele, candidate_data_ele):
+                diff.append("%s %s" % (op, path))
+                xml = to_text(etree.tostring(ele, with_tail=False)).strip()
+                diff.extend("%s   %s" % (op, line) for line in xml.splitlines())
+            if diff:
+                return "\n".join(diff)
 
     return None
 
@@ -407,6 +620,24 @@ def get_config(module, config_filter=None, source="running"):
     return cfg
 
 
+def build_edit_config(command_filter):
+    """Merges the <config> payloads of the edit filters into one,
+    so that they are sent with a single edit-config
+
+    :param command_filter: edit filter, or list of them, as build_xml() returns
+    :returns: the config payload as a string
+    """
+    filters = to_list(command_filter)
+    if len(filters) == 1:
+        return filters[0]
+
+    root = etree.Element("config", nsmap=NS_DICT["BASE_NSMAP"])
+    for item in filters:
+        config = etree.fromstring(to_bytes(item))
+        root.extend(list(config))
+    return etree.tostring(root, encoding="unicode")
+
+
 def check_existing_commit_labels(conn, label):
     out = conn.get(command="show configuration history detail | include %s" % label)
     label_exist = re.search(label, out, re.M)
@@ -432,16 +663,16 @@ def load_config(
 
     diff = None
     if is_netconf(module):
-        # FIXME: check for platform behaviour and restore this
-        # conn.lock(target = 'candidate')
-        # conn.discard_changes()
-
+        locked = False
         try:
-            for filter in to_list(command_filter):
-                conn.edit_config(config=filter, remove_ns=True)
+            conn.lock(target="candidate")
+            locked = True
+            conn.edit_config(config=build_edit_config(command_filter), remove_ns=True)
 
-            candidate = get_config(module, source="candidate", config_filter=nc_get_filter)
-            diff = get_config_diff(module, running, candidate)
+            if running is not None:
+                # the candidate is only needed to diff it with running
+                candidate = get_config(module, source="candidate", config_filter=nc_get_filter)
+                diff = get_config_diff(module, running, candidate)
 
             if commit and diff:
                 commit_config(module)
@@ -450,8 +681,11 @@ def load_config(
         except ConnectionError as exc:
             module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
         finally:
-            # conn.unlock(target = 'candidate')
-            pass
+            if locked:
+                try:
+                    conn.unlock(target="candidate")
+                except ConnectionError:
+                    pass
 
     elif is_cliconf(module):
         try:
@@ -17,7 +17,7 @@ the given network resource.
 
 import re
 
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.network_template import (
     NetworkTemplate,
 )
 
@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+"""
+The iosxr NetworkTemplate, it extends the netcommon NetworkTemplate
+with a first keyword dispatch index so that each config line is only
+matched against the parsers that can possibly match it, and collects
+the parse result in place instead of copying it for every line.
+Jinja templates, both setval/remval and parser results, are compiled
+once per process instead of on every render, and the parsed facts are
+validated with the compiled schema walker of utils.validation.
+"""
+
+import ast
+import re
+
+from collections.abc import Mapping
+from itertools import chain
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
+    NetworkTemplate as _NetworkTemplate,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    Template as _Template,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    dict_merge,
+    sort_list,
+)
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.validation import (
+    has_no_log,
+    validate_config,
+)
+
+
+try:
+    from ansible.module_utils.common.parameters import _list_no_log_values as list_no_log_values
+except ImportError:
+    # TODO: Remove this import when we no longer support ansible < 2.11
+    from ansible.module_utils.common.parameters import list_no_log_values
+
+
+try:
+    from jinja2.exceptions import UndefinedError
+except ImportError:
+    UndefinedError = None
+
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_constants
+    import sre_parse
+
+
+KEY_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
+SPACE_CHARS = frozenset(" \t")
+LINE_KEY = re.compile(r"\s*([A-Za-z0-9]*)")
+
+# parser keys are either the exact leading keyword of the lines a parser
+# can match or a prefix of it, WILDCARD means the parser can match any line
+EXACT, PREFIX = "exact", "prefix"
+WILDCARD = None
+
+_DISPATCH_INDEX = {}
+_COMPILED_TEMPLATES = {}
+_RENDER_TEMPLATES = {}
+
+
+def _is_space(item):
+    """True if item only ever consumes whitespace"""
+    op, av = item
+    if op is sre_constants.LITERAL:
+        return chr(av) in SPACE_CHARS
+    if op is sre_constants.IN:
+        return av == [(sre_constants.CATEGORY, sre_constants.CATEGORY_SPACE)]
+    if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+        return all(_is_space(sub) for sub in av[2])
+    return False
+
+
+def _ends_key(item):
+    """True if item can only match a character that ends a keyword"""
+    op, av = item
+    if op is sre_constants.LITERAL:
+        return chr(av) not in KEY_CHARS
+    if op is sre_constants.AT:
+        return av in (sre_constants.AT_END, sre_constants.AT_BOUNDARY)
+    if op is sre_constants.IN:
+        return av in (
+            [(sre_constants.CATEGORY, sre_constants.CATEGORY_SPACE)],
+            [(sre_constants.CATEGORY, sre_constants.CATEGORY_NOT_WORD)],
+        )
+    return _is_space(item) and av[0] > 0
+
+
+def _pattern_keys(items, key=None):
+    """Walks the parsed regex and returns the set of (EXACT|PREFIX, keyword)
+    the first keyword of a matching line can have, WILDCARD when unknown
+
+    :param items: the remaining regex items
+    :param key: the keyword literal collected so far, None while
+                leading whitespace is still being consumed
+    """
+    for idx, (op, av) in enumerate(items):
+        rest = items[idx + 1 :]  # noqa: E203
+        if op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            # zero width, ignoring it can only widen the match
+            continue
+        if op is sre_constants.AT and av is sre_constants.AT_BEGINNING and key is None:
+            continue
+        if op is sre_constants.SUBPATTERN:
+            return _pattern_keys(list(av[-1]) + rest, key)
+        if op is sre_constants.IN and all(sub[0] is sre_constants.LITERAL for sub in av):
+            # single character alternations are folded into a set by the parser
+            op, av = sre_constants.BRANCH, (None, [[sub] for sub in av])
+        if op is sre_constants.BRANCH:
+            keys = set()
+            for branch in av[1]:
+                branch_keys = _pattern_keys(list(branch) + rest, key)
+                if branch_keys is WILDCARD:
+                    return WILDCARD
+                keys.update(branch_keys)
+            return keys
+        if key is None:
+            if _is_space((op, av)):
+                continue
+            if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and av[:2] == (0, 1):
+                keys = _pattern_keys(list(av[2]) + rest, key)
+                skipped = _pattern_keys(rest, key)
+                if keys is WILDCARD or skipped is WILDCARD:
+                    return WILDCARD
+                return keys | skipped
+            if op is sre_constants.LITERAL and chr(av) in KEY_CHARS:
+                key = chr(av)
+                continue
+            if op is sre_constants.LITERAL or (op, av) == (sre_constants.AT, sre_constants.AT_END):
+                return {(EXACT, "")}
+            return WILDCARD
+        if op is sre_constants.LITERAL and chr(av) in KEY_CHARS:
+            key += chr(av)
+            continue
+        if _ends_key((op, av)):
+            return {(EXACT, key)}
+        return {(PREFIX, key)}
+    if key is None:
+        return WILDCARD
+    return {(PREFIX, key)}
+
+
+def parser_keys(getval):
+    """Returns the keywords lines matched by a getval regex start with
+
+    :param getval: compiled regex or pattern string
+    :rtype: set
+    :returns: set of (EXACT|PREFIX, keyword), WILDCARD when unknown
+    """
+    if isinstance(getval, str):
+        getval = re.compile(getval)
+    if getval.flags & re.IGNORECASE:
+        return WILDCARD
+    try:
+        items = list(sre_parse.parse(getval.pattern, getval.flags))
+    except Exception:
+        return WILDCARD
+    return _pattern_keys(items)
+
+
+class DispatchIndex(object):
+    """Maps the first keyword of a config line to the parsers,
+    in PARSERS order, that may match it
+    """
+
+    def __init__(self, parsers):
+        self.parsers = parsers
+        self.parser_keys = [parser_keys(parser["getval"]) for parser in parsers]
+        self.by_name = {}
+        for parser in parsers:
+            self.by_name.setdefault(parser["name"], parser)
+        self._candidates = {}
+
+    def candidates(self, line):
+        key = LINE_KEY.match(line).group(1)
+        if key not in self._candidates:
+            self._candidates[key] = tuple(
+                parser
+                for parser, keys in zip(self.parsers, self.parser_keys)
+                if keys is WILDCARD
+                or any(
+                    kword == key if kind is EXACT else key.startswith(kword) for kind, kword in keys
+                )
+            )
+        return self._candidates[key]
+
+
+def merge_into(base, other):
+    """Merges other into base in place, with the same result as
+    netcommon dict_merge(base, other) but without copying base
+
+    :param base: dict object the parse result is collected in
+    :param other: dict object to combine with base
+    :returns: base
+    """
+    for key, value in list(base.items()):
+        if key not in other:
+            continue
+        item = other[key]
+        if isinstance(value, dict):
+            if item is not None and isinstance(item, Mapping):
+                merge_into(value, item)
+            else:
+                base[key] = item
+        elif isinstance(value, list):
+            if item is not None:
+                try:
+                    base[key] = list(set(chain(value, item)))
+                except TypeError:
+                    value.extend([i for i in item if i not in value])
+            else:
+                base[key] = item
+        elif item is None or sort_list(value) != sort_list(item):
+            base[key] = item
+
+    for key in set(other.keys()).difference(base.keys()):
+        base[key] = other[key]
+    return base
+
+
+def get_dispatch_index(tmplt):
+    """Returns the DispatchIndex of a template class, built on first use"""
+    cls = type(tmplt)
+    if cls not in _DISPATCH_INDEX:
+        _DISPATCH_INDEX[cls] = DispatchIndex(tmplt.PARSERS)
+    return _DISPATCH_INDEX[cls]
+
+
+class Template(_Template):
+    """netcommon Template that shares one jinja2 Environment and compiles
+    each template string only once per process
+    """
+
+    _env = None
+
+    def __init__(self):
+        if Template._env is None:
+            super(Template, self).__init__()
+            Template._env = self.env
+        self.env = Template._env
+
+    def compile(self, value):
+        """Returns the compiled jinja2 template for value"""
+        compiled = _COMPILED_TEMPLATES.get(value)
+        if compiled is None:
+            compiled = _COMPILED_TEMPLATES[value] = self.env.from_string(value)
+        return compiled
+
+    def __call__(self, value, variables=None, fail_on_undefined=True):
+        variables = variables or {}
+
+        if not self.contains_vars(value):
+            return value
+
+        try:
+            value = self.compile(value).render(variables)
+        except UndefinedError:
+            if not fail_on_undefined:
+                return None
+            raise
+
+        if value:
+            try:
+                return ast.literal_eval(value)
+            except Exception:
+                return str(value)
+        else:
+            return None
+
+
+class NetworkTemplate(_NetworkTemplate):
+    """The NetworkTemplate class that iosxr Resource Module templates
+    inherit and use to parse and render config lines.
+    """
+
+    def __init__(self, lines=None, tmplt=None, prefix=None, module=None):
+        super(NetworkTemplate, self).__init__(
+            lines=lines,
+            tmplt=tmplt,
+            prefix=prefix,
+            module=module,
+        )
+        self._template = Template()
+
+    def parse(self):
+        """parse"""
+        result = {}
+        shared = {}
+        index = get_dispatch_index(self._tmplt)
+        for line in self._lines:
+            for parser in index.candidates(line):
+                cap = re.match(parser["getval"], line)
+                if cap:
+                    capdict = cap.groupdict()
+                    capdict = dict((k, v) for k, v in capdict.items() if v is not None)
+                    if parser.get("shared"):
+                        shared = capdict
+                    vals = dict_merge(capdict, shared)
+                    res = self._deepformat(parser["result"], vals)
+                    merge_into(result, res)
+                    break
+        return result
+
+    def get_parser(self, name):
+        """get_parsers"""
+        parsers = get_dispatch_index(self._tmplt).by_name
+        if name not in parsers:
+            return super(NetworkTemplate, self).get_parser(name)
+        return parsers[name]
+
+    def render(self, data, parser_name, negate=False):
+        """render"""
+        key = (type(self._tmplt), parser_name, negate)
+        tmplt = _RENDER_TEMPLATES.get(key)
+        if tmplt is None:
+            parser = self.get_parser(parser_name)
+            if negate:
+                tmplt = parser.get("remval") or parser["setval"]
+            else:
+                tmplt = parser["setval"]
+            _RENDER_TEMPLATES[key] = tmplt
+        return self._render(tmplt, data, negate)
+
+    def validate_config(self, spec, data, redact=False):
+        """validate_config"""
+        validated_data = validate_config(spec, data)
+        if redact and has_no_log(spec):
+            self._module.no_log_values.update(list_no_log_values(spec, validated_data))
+        return validated_data
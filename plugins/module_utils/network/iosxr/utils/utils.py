@@ -10,14 +10,15 @@ from __future__ import absolute_import, division, print_function
 
 
 __metaclass__ = type
-from functools import total_ordering
+from copy import deepcopy
+from functools import lru_cache, total_ordering
 
 from ansible.module_utils._text import to_text
 from ansible.module_utils.basic import missing_required_lib
 from ansible.module_utils.common.network import is_masklen, to_netmask
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_diff,
-    search_obj_in_list,
+    remove_empties,
 )
 
 
@@ -197,6 +198,20 @@ def pad_commands(commands, interface):
     commands.insert(0, "interface {0}".format(interface))
 
 
+def index_obj_in_list(lst, key="name"):
+    """Index a list of dicts by key for repeated lookups,
+        like search_obj_in_list the first object wins on
+        duplicate keys.
+    :param lst: list of dicts
+    :param key: str
+    :returns: dict of the objects by key
+    """
+    index = {}
+    for item in lst or []:
+        index.setdefault(item.get(key), item)
+    return index
+
+
 def diff_list_of_dicts(w, h, key="member"):
     """
     Returns a list containing diff between
@@ -208,8 +223,9 @@ def diff_list_of_dicts(w, h, key="member"):
         h = []
 
     diff = []
+    h_index = index_obj_in_list(h, key=key)
     for w_item in w:
-        h_item = search_obj_in_list(w_item[key], h, key=key) or {}
+        h_item = h_index.get(w_item[key]) or {}
         d = dict_diff(h_item, w_item)
         if d:
             if key not in d.keys():
@@ -420,27 +436,243 @@ def prefix_to_address_wildcard(prefix):
 def flatten_config(data, context):
     """Flatten different contexts in
         the running-config for easier parsing.
-    :param data: dict
-    :param context: str
+    :param data: str
+    :param context: str, or a list of str to flatten several contexts,
+                    in order, in a single pass over the config
     :returns: flattened running config
     """
+    contexts = [context] if isinstance(context, str) else list(context)
+    # (context line, indent, in context) of the last match per context
+    state = [None] * len(contexts)
     data = data.split("\n")
-    in_cxt = False
-    cur = {}
 
     for index, x in enumerate(data):
-        cur_indent = len(x) - len(x.lstrip())
-        if x.strip().startswith(context):
-            in_cxt = True
-            cur["context"] = x
-            cur["indent"] = cur_indent
-        elif cur and (cur_indent <= cur["indent"]):
-            in_cxt = False
-        elif in_cxt:
-            data[index] = cur["context"] + " " + x.strip()
+        stripped = x.lstrip()
+        cur_indent = len(x) - len(stripped)
+        stripped = stripped.rstrip()
+        for cidx, cxt in enumerate(contexts):
+            cur = state[cidx]
+            if stripped.startswith(cxt):
+                state[cidx] = (x, cur_indent, True)
+            elif cur and (cur_indent <= cur[1]):
+                state[cidx] = (cur[0], cur[1], False)
+            elif cur and cur[2]:
+                x = cur[0] + " " + stripped
+                stripped = x.lstrip()
+                cur_indent = len(x) - len(stripped)
+                stripped = stripped.rstrip()
+        data[index] = x
     return "\n".join(data)
 
 
+def split_config_sections(data):
+    """Split a running-config into its top-level sections.
+        Indented lines, `!` separators and RPL style `end-*`
+        terminators stay with the section they follow.
+    :param data: str
+    :returns: list of (header, section) tuples in device order
+    """
+    sections = []
+    header, lines = None, []
+
+    for line in data.splitlines():
+        if not line or line[0] in (" ", "!") or line.startswith("end-"):
+            if header is not None:
+                lines.append(line)
+            continue
+        if header is not None:
+            sections.append((header, "\n".join(lines)))
+        if line == "end":
+            header, lines = None, []
+        else:
+            header, lines = line, [line]
+
+    if header is not None:
+        sections.append((header, "\n".join(lines)))
+    return sections
+
+
+def get_config_section(sections, keys):
+    """Join the top-level sections whose header starts
+        with any of the given keywords, preserving device order.
+    :param sections: list of (header, section) tuples
+    :param keys: iterable of str
+    :returns: the matching config sections
+    """
+    keys = tuple(keys)
+    matched = []
+    for header, section in sections:
+        for key in keys:
+            if header == key or header.startswith(key + " "):
+                matched.append(section)
+                break
+    return "\n".join(matched)
+
+
+class BgpConfig(object):
+    """Flattened views of a `router bgp` block shared by the BGP
+    resource fact collectors, use get_bgp_config() to obtain it
+    so that each view is only built once per run.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self._views = {}
+
+    def _neighbor_group_data(self):
+        """The top-level lines and the neighbor-group sub-sections
+        of the block, in config order
+        """
+        lines, keep = [], False
+        for line in self.data.split("\n"):
+            indent = len(line) - len(line.lstrip())
+            if indent == 0:
+                keep = True
+            elif indent == 1 and not line.startswith(" !"):
+                keep = line.split()[:1] == ["neighbor-group"]
+            if keep:
+                lines.append(line)
+        return "\n".join(lines)
+
+    @property
+    def neighbor_data(self):
+        """The block with neighbor contexts flattened"""
+        if "neighbor" not in self._views:
+            self._views["neighbor"] = flatten_config(self.data, "neighbor")
+        return self._views["neighbor"]
+
+    @property
+    def global_lines(self):
+        """Lines for bgp_global, address-family contexts removed"""
+        if "global" not in self._views:
+            data = flatten_config(
+                self.neighbor_data,
+                ["rpki server", "bgp confederation peers"],
+            )
+            lines, start = [], False
+            for line in data.splitlines():
+                if "address-family" in line:
+                    start = True
+                if not start:
+                    lines.append(line)
+                if start and "!" in line:
+                    start = False
+            self._views["global"] = lines
+        return self._views["global"]
+
+    @property
+    def address_family_lines(self):
+        """Lines for bgp_address_family and bgp_neighbor_address_family"""
+        if "address_family" not in self._views:
+            self._views["address_family"] = flatten_config(
+                self.neighbor_data,
+                "vrf",
+            ).splitlines()
+        return self._views["address_family"]
+
+    @property
+    def template_lines(self):
+        """Lines for bgp_templates, only neighbor-group contexts are kept"""
+        if "template" not in self._views:
+            self._views["template"] = flatten_config(
+                self._neighbor_group_data(),
+                "neighbor-group",
+            ).splitlines()
+        return self._views["template"]
+
+
+@lru_cache(maxsize=1)
+def get_bgp_config(data):
+    """Returns the BgpConfig for a `router bgp` block,
+        consecutive collectors given the same block share it.
+    :param data: str
+    :returns: BgpConfig
+    """
+    return BgpConfig(data)
+
+
+class FactSkeleton(dict):
+    """Stands in for a deepcopy() of the dict generated from the argspec
+    in the facts render_config methods, nested dicts of the spec are only
+    created when they are accessed and remove_empties() returns the same
+    fact, in the same key order, as netcommon remove_empties() would on
+    the deep copy.
+    """
+
+    def __init__(self, spec):
+        super(FactSkeleton, self).__init__()
+        self.spec = spec
+
+    def __missing__(self, key):
+        value = self.spec[key]
+        if isinstance(value, dict):
+            value = FactSkeleton(value)
+        elif value is not None:
+            value = deepcopy(value)
+        self[key] = value
+        return value
+
+    def remove_empties(self):
+        """Generate final config dictionary
+        :returns: A dictionary by eliminating keys that have null values
+        """
+        keys = [key for key in self.spec if key in self]
+        keys.extend(key for key in self if key not in self.spec)
+
+        fact = {}
+        for key in keys:
+            val = self[key]
+            if isinstance(val, FactSkeleton):
+                val = val.remove_empties()
+                if not val:
+                    continue
+            elif isinstance(val, dict):
+                val = remove_empties(val)
+                if not val:
+                    continue
+            elif isinstance(val, list) and val and all(isinstance(x, dict) for x in val):
+                val = [remove_empties(x) for x in val]
+            elif val in [None, [], {}, (), ""]:
+                continue
+            fact[key] = val
+        return fact
+
+
+class InterfaceSections(object):
+    """Per-interface blocks of `show running-config interface` output
+    shared by the interface resource fact collectors, use
+    get_interface_sections() to obtain it so that the output is
+    only split once per run.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        # blocks keep the form the collectors have always parsed, i.e. without
+        # the leading `interface` keyword, the first one holds any preamble
+        self.blocks = ("\n" + data).split("\ninterface ")
+        self._lines = None
+
+    def __iter__(self):
+        return iter(self.blocks)
+
+    @property
+    def lines(self):
+        """All config lines, for the template based collectors"""
+        if self._lines is None:
+            self._lines = self.data.splitlines()
+        return self._lines
+
+
+@lru_cache(maxsize=1)
+def get_interface_sections(data):
+    """Returns the InterfaceSections for interface config,
+        consecutive collectors given the same config share it.
+    :param data: str
+    :returns: InterfaceSections
+    """
+    return InterfaceSections(data)
+
+
 @total_ordering
 class Version:
     """Simple class to compare arbitrary versions"""
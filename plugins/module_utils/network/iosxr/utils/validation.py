@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+"""
+Validation of the facts rendered by the iosxr fact collectors.
+
+validate_config() returns the same result as netcommon validate_config()
+but walks the data with a schema compiled once per argspec instead of
+building an AnsibleModule for every call. Whenever the data needs more
+than the walker models, i.e. unknown keys or aliases, values that can
+not be converted, failed choices or required checks, it falls back to
+the netcommon implementation so that errors are reported as before.
+"""
+
+from copy import deepcopy
+
+from ansible.module_utils.common.parameters import DEFAULT_TYPE_VALIDATORS
+from ansible.module_utils.common.validation import (
+    check_mutually_exclusive,
+    check_required_by,
+    check_required_if,
+    check_required_one_of,
+    check_required_together,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    validate_config as _validate_config,
+)
+
+
+# option settings the walker does not model, specs using them are
+# always validated by netcommon validate_config()
+UNSUPPORTED = frozenset(
+    (
+        "apply_defaults",
+        "deprecated_aliases",
+        "fallback",
+        "removed_at_date",
+        "removed_in_version",
+    ),
+)
+
+# checks applied to the suboptions of an option, in the validator order
+ADDITIONAL_CHECKS = (
+    ("required_together", check_required_together),
+    ("required_one_of", check_required_one_of),
+    ("required_if", check_required_if),
+    ("required_by", check_required_by),
+)
+
+_COMPILED = {}
+
+
+class Fallback(Exception):
+    """The data needs the full validation"""
+
+
+class CompiledOption(object):
+    """An option of the argspec, with its type checkers resolved"""
+
+    __slots__ = (
+        "name",
+        "checker",
+        "elements_checker",
+        "choices",
+        "required",
+        "default",
+        "options",
+        "container",
+    )
+
+    def __init__(self, name, spec):
+        if UNSUPPORTED.intersection(spec):
+            raise Fallback(name)
+        self.name = name
+        self.checker = _type_checker(spec.get("type"))
+        self.elements_checker = None
+        if spec.get("elements"):
+            self.elements_checker = _type_checker(spec["elements"])
+        self.choices = spec.get("choices")
+        if self.choices is not None and (
+            isinstance(self.choices, (bytes, str)) or not hasattr(self.choices, "__iter__")
+        ):
+            raise Fallback(name)
+        self.required = spec.get("required", False)
+        self.default = spec.get("default")
+        self.options = None
+        wanted = spec.get("type")
+        if spec.get("options") is not None and (
+            wanted == "dict" or (wanted == "list" and spec.get("elements", "") == "dict")
+        ):
+            self.options = CompiledSpec(spec["options"], spec)
+        self.container = wanted if wanted in ("dict", "list") else None
+
+
+class CompiledSpec(object):
+    """The options of an argspec level and the checks that apply to them"""
+
+    __slots__ = ("options", "by_name", "defaults", "mutually_exclusive", "checks", "no_log")
+
+    def __init__(self, spec, parent=None):
+        parent = parent or {}
+        self.options = [CompiledOption(name, value) for name, value in spec.items()]
+        self.by_name = dict((option.name, option) for option in self.options)
+        self.defaults = [option for option in self.options if option.default is not None]
+        self.mutually_exclusive = parent.get("mutually_exclusive")
+        self.checks = [
+            (func, parent[attr]) for attr, func in ADDITIONAL_CHECKS if parent.get(attr) is not None
+        ]
+        self.no_log = any(
+            value.get("no_log", False) or (option.options is not None and option.options.no_log)
+            for option, value in zip(self.options, spec.values())
+        )
+
+
+def _type_checker(wanted):
+    if callable(wanted):
+        return wanted
+    checker = DEFAULT_TYPE_VALIDATORS.get("str" if wanted is None else wanted)
+    if checker is None:
+        raise Fallback(wanted)
+    return checker
+
+
+def compile_spec(spec):
+    """Returns the CompiledSpec of an argspec, compiled on first use
+
+    :param spec: Ansible argument spec
+    :returns: CompiledSpec, None when the spec uses settings
+              the walker does not model
+    """
+    key = id(spec)
+    if key not in _COMPILED or _COMPILED[key][0] is not spec:
+        try:
+            compiled = CompiledSpec(spec)
+        except Fallback:
+            compiled = None
+        _COMPILED[key] = (spec, compiled)
+    return _COMPILED[key][1]
+
+
+def _walk(spec, params, context):
+    """Validates params against a CompiledSpec in the order
+    the argspec validator does and returns a validated copy
+    """
+    if not isinstance(params, dict):
+        raise Fallback(context)
+    for key in params:
+        if key not in spec.by_name:
+            raise Fallback(key)
+
+    result = dict(params)
+    try:
+        if spec.mutually_exclusive:
+            check_mutually_exclusive(spec.mutually_exclusive, result, context)
+    except TypeError:
+        raise Fallback(context)
+
+    for option in spec.defaults:
+        if option.name not in result:
+            result[option.name] = option.default
+
+    for option in spec.options:
+        if option.name not in result:
+            if option.required:
+                raise Fallback(option.name)
+            continue
+
+        value = result[option.name]
+        if value is None and not option.required and option.default is None:
+            if option.choices is not None:
+                raise Fallback(option.name)
+            continue
+
+        try:
+            value = option.checker(value)
+            if option.elements_checker is not None:
+                if not isinstance(value, list):
+                    raise Fallback(option.name)
+                value = [option.elements_checker(item) for item in value]
+        except (TypeError, ValueError):
+            raise Fallback(option.name)
+
+        if option.choices is not None:
+            if isinstance(value, list):
+                if any(item not in option.choices for item in value):
+                    raise Fallback(option.name)
+            elif value not in option.choices:
+                raise Fallback(option.name)
+
+        if option.options is not None:
+            context.append(option.name)
+            if option.container == "list":
+                if not isinstance(value, list):
+                    raise Fallback(option.name)
+                value = [_walk(option.options, item, context) for item in value]
+            else:
+                value = _walk(option.options, value, context)
+            context.pop()
+        elif option.container is not None or isinstance(value, (dict, list)):
+            # the validator works on a deep copy of the data
+            value = deepcopy(value)
+        result[option.name] = value
+
+    try:
+        for func, terms in spec.checks:
+            func(terms, result, context)
+    except TypeError:
+        raise Fallback(context)
+
+    for option in spec.options:
+        if option.name not in result:
+            result[option.name] = None
+    return result
+
+
+def validate_config(spec, data):
+    """
+    Validate the input data against the AnsibleModule spec format,
+    returns the same validated data as netcommon validate_config()
+    :param spec: Ansible argument spec
+    :param data: Data to be validated
+    :return: validated data
+    """
+    compiled = compile_spec(spec)
+    if compiled is not None:
+        try:
+            return _walk(compiled, data, [])
+        except Fallback:
+            pass
+    return _validate_config(spec, data)
+
+
+def has_no_log(spec):
+    """True if any option of the argspec is no_log"""
+    compiled = compile_spec(spec)
+    return compiled is None or compiled.no_log
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+"""
+Helpers for the fact collectors that read the IOS XR YANG JSON config
+returned by the gRPC GetConfig call instead of the running-config text.
+"""
+
+import json
+
+from ansible.module_utils.connection import ConnectionError
+
+
+def get_yang_config(connection, section):
+    """Returns the YANG JSON config of section
+
+    :param connection: the device connection, over ansible.netcommon.grpc
+    :param section: the yangpathjson filter, e.g.
+                    {"Cisco-IOS-XR-ip-static-cfg:router-static": [None]}
+    :rtype: dict
+    :returns: the decoded config, empty when nothing is configured
+    """
+    output = connection.get_config(section=json.dumps(section))
+    if output.get("error"):
+        raise ConnectionError(output["error"])
+    return json.loads(output.get("response") or "{}")
+
+
+def yang_get(data, *keys):
+    """Returns the value at the path of keys in the YANG JSON data,
+    None if any of the containers on the path does not exist
+    """
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def yang_list(data, *keys):
+    """Returns the YANG list at the path of keys, empty if not configured"""
+    return yang_get(data, *keys) or []
+
+
+def check_yang_leaves(data, known, context):
+    """Raises ValueError if data holds leaves a renderer does not know,
+    so that they are reported instead of silently missing from the facts
+
+    :param data: a container or list entry of the YANG JSON config
+    :param known: the leaves the renderer reads or knowingly ignores
+    :param context: where data is, for the error message
+    """
+    unknown = sorted(set(data) - set(known))
+    if unknown:
+        raise ValueError(
+            "unsupported YANG leaves in %s: %s" % (context, ", ".join(unknown)),
+        )
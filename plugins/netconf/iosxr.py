@@ -41,14 +41,12 @@ options:
 """
 
 import collections
+import io
 import json
 import re
 
 from ansible.errors import AnsibleConnectionFailure
-from ansible.module_utils._text import to_native, to_text
-from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.netconf import (
-    remove_namespaces,
-)
+from ansible.module_utils._text import to_bytes, to_native, to_text
 from ansible_collections.ansible.netcommon.plugins.plugin_utils.netconf_base import (
     NetconfBase,
     ensure_ncclient,
@@ -61,6 +59,7 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr im
 
 
 try:
+    from lxml import etree
     from ncclient import manager
     from ncclient.operations import RPCError
     from ncclient.transport.errors import SSHUnknownHostError
@@ -74,6 +73,48 @@ except (
     HAS_NCCLIENT = False
 
 
+def iterparse_reply(reply, tag=None):
+    """Parses an rpc reply incrementally, removing the namespaces
+
+    :param reply: the ncclient reply, or its xml
+    :param tag: only yield the elements with this local name
+    :returns: an iterator of the elements of the reply, each yielded
+              once it is complete, in the order they end
+    """
+    data = getattr(reply, "xml", reply)
+    for dummy, ele in etree.iterparse(
+        io.BytesIO(to_bytes(data, errors="surrogate_then_replace").strip()),
+        remove_blank_text=True,
+        huge_tree=True,
+    ):
+        name = ele.tag
+        if not isinstance(name, str):
+            continue
+        if name[0] == "{":
+            name = ele.tag = name.split("}", 1)[1]
+        attrib = ele.attrib
+        if attrib:
+            for key in [key for key in attrib if key[0] == "{"]:
+                attrib[key.split("}", 1)[1]] = attrib.pop(key)
+        if tag is None or name == tag:
+            yield ele
+
+
+def parse_reply(reply):
+    """Returns the root element of an rpc reply without namespaces
+
+    The reply is parsed once, incrementally, instead of being serialized
+    and transformed as remove_namespaces() does.
+    """
+    ele = None
+    for ele in iterparse_reply(reply):
+        pass
+    if ele is not None:
+        ele = ele.getroottree().getroot()
+        etree.cleanup_namespaces(ele)
+    return ele
+
+
 class Netconf(NetconfBase):
     def get_device_info(self):
         device_info = {}
@@ -105,14 +146,11 @@ class Netconf(NetconfBase):
             namespace="install",
         )
         try:
-            reply = self.get(install_filter)
-            resp = remove_namespaces(
-                re.sub(r'<\?xml version="1.0" encoding="UTF-8"\?>', "", reply),
-            )
-            ele_package_name = etree_find(resp.strip(), "name")
+            resp = parse_reply(self._get(install_filter))
+            ele_package_name = etree_find(resp, "name")
             if ele_package_name is not None:
                 device_info["network_os_package"] = ele_package_name.text
-            ele_label = etree_find(resp.strip(), "label")
+            ele_label = etree_find(resp, "label")
             if ele_label is not None:
                 device_info["network_os_version"] = ele_label.text
 
@@ -121,7 +159,7 @@ class Netconf(NetconfBase):
                 r"^[Cc]isco (.+) \(revision",
                 r"^[Cc]isco (\S+ \S+).+bytes of .*memory",
             ]
-            ele_hardware_info = etree_find(resp.strip(), "hardware-info")
+            ele_hardware_info = etree_find(resp, "hardware-info")
             if ele_hardware_info is not None:
                 for item in model_search_strs:
                     match = re.search(item, ele_hardware_info.text, re.M)
@@ -143,11 +181,8 @@ class Netconf(NetconfBase):
                 opcode="filter",
                 namespace="host-names",
             )
-            reply = self.get(hostname_filter)
-            resp = remove_namespaces(
-                re.sub(r'<\?xml version="1.0" encoding="UTF-8"\?>', "", reply),
-            )
-            hostname_ele = etree_find(resp.strip(), "host-name")
+            resp = parse_reply(self._get(hostname_filter))
+            hostname_ele = etree_find(resp, "host-name")
             device_info["network_os_hostname"] = (
                 hostname_ele.text if hostname_ele is not None else None
             )
@@ -207,26 +242,29 @@ class Netconf(NetconfBase):
         return guessed_os
 
     # TODO: change .xml to .data_xml, when ncclient supports data_xml on all platforms
-    def get(self, filter=None, with_defaults=None, remove_ns=False):
+    def _get(self, filter=None, with_defaults=None):
         if isinstance(filter, list):
             filter = tuple(filter)
         try:
-            resp = self.m.get(filter=filter, with_defaults=with_defaults)
-            if remove_ns:
-                response = remove_namespaces(resp)
-            else:
-                response = resp.data_xml if hasattr(resp, "data_xml") else resp.xml
-            return response
+            return self.m.get(filter=filter, with_defaults=with_defaults)
         except RPCError as exc:
             raise Exception(to_xml(exc.xml))
 
+    def get(self, filter=None, with_defaults=None, remove_ns=False):
+        resp = self._get(filter=filter, with_defaults=with_defaults)
+        if remove_ns:
+            response = to_xml(parse_reply(resp))
+        else:
+            response = resp.data_xml if hasattr(resp, "data_xml") else resp.xml
+        return response
+
     def get_config(self, source=None, filter=None, remove_ns=False):
         if isinstance(filter, list):
             filter = tuple(filter)
         try:
             resp = self.m.get_config(source=source, filter=filter)
             if remove_ns:
-                response = remove_namespaces(resp)
+                response = to_xml(parse_reply(resp))
             else:
                 response = resp.data_xml if hasattr(resp, "data_xml") else resp.xml
             return response
@@ -255,7 +293,7 @@ class Netconf(NetconfBase):
                 error_option=error_option,
             )
             if remove_ns:
-                response = remove_namespaces(resp)
+                response = to_xml(parse_reply(resp))
             else:
                 response = resp.data_xml if hasattr(resp, "data_xml") else resp.xml
             return response
@@ -277,7 +315,7 @@ class Netconf(NetconfBase):
                 persist=persist,
             )
             if remove_ns:
-                response = remove_namespaces(resp)
+                response = to_xml(parse_reply(resp))
             else:
                 response = resp.data_xml if hasattr(resp, "data_xml") else resp.xml
             return response
@@ -288,7 +326,7 @@ class Netconf(NetconfBase):
         try:
             resp = self.m.validate(source=source)
             if remove_ns:
-                response = remove_namespaces(resp)
+                response = to_xml(parse_reply(resp))
             else:
                 response = resp.data_xml if hasattr(resp, "data_xml") else resp.xml
             return response
@@ -299,7 +337,7 @@ class Netconf(NetconfBase):
         try:
             resp = self.m.discard_changes()
             if remove_ns:
-                response = remove_namespaces(resp)
+                response = to_xml(parse_reply(resp))
             else:
                 response = resp.data_xml if hasattr(resp, "data_xml") else resp.xml
             return response
@@ -353,17 +391,14 @@ class Netconf(NetconfBase):
             namespace="install_old",
         )
         try:
-            reply = self.get(install_filter)
-            resp = remove_namespaces(
-                re.sub(r'<\?xml version="1.0" encoding="UTF-8"\?>', "", reply),
-            )
+            resp = parse_reply(self._get(install_filter))
             ele_boot_variable = etree_find(resp, "boot-variable/boot-variable")
             if ele_boot_variable is not None:
                 device_info["network_os_image"] = re.split(
                     "[:|,]",
                     ele_boot_variable.text,
                 )[1]
-            ele_package_name = etree_find(reply, "package-name")
+            ele_package_name = etree_find(resp, "package-name")
             if ele_package_name is not None:
                 device_info["network_os_package"] = ele_package_name.text
                 device_info["network_os_version"] = re.split(
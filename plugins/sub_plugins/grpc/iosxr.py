@@ -17,71 +17,170 @@ description:
 version_added: "3.3.0"
 """
 
+import importlib.util
 import json
 import os
-import sys
 
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils.common.text.converters import to_text
+from ansible.module_utils.connection import ConnectionError
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    to_list,
+)
 from ansible_collections.ansible.netcommon.plugins.sub_plugins.grpc.base import (
     GrpcBase,
     ensure_connect,
 )
 
 
-class Grpc(GrpcBase):
-    def __init__(self, connection):
-        super(Grpc, self).__init__(connection)
-        module_name = "ems_grpc_pb2"
+_EMS_GRPC_PB2 = None
+
+# default maximum number of GetOper calls get_batch keeps in flight
+GET_BATCH_WORKERS = 8
+
+# CreateSubs encode values of the telemetry encodings
+TELEMETRY_ENCODINGS = dict(gpb=2, gpbkv=3, json=4)
+
+
+def _deadline_exceeded(exc):
+    """True if exc is the error a stream ends with at its deadline,
+    for both the beta and the current grpc interfaces
+    """
+    if type(exc).__name__ == "ExpirationError":
+        return True
+    code = getattr(exc, "code", None)
+    return callable(code) and getattr(code(), "name", None) == "DEADLINE_EXCEEDED"
+
+
+def load_ems_grpc_pb2():
+    """Returns the ems_grpc_pb2 module, it is loaded once per process
+    as the generated descriptors can only be registered once
+    """
+    global _EMS_GRPC_PB2
+    if _EMS_GRPC_PB2 is None:
         module_path = os.path.join(
             os.path.dirname(os.path.realpath(__file__)),
             "pb/ems_grpc_pb2.py",
         )
-        if sys.version_info[0] == 3 and sys.version_info[1] >= 5:
-            import importlib.util
+        spec = importlib.util.spec_from_file_location("ems_grpc_pb2", module_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _EMS_GRPC_PB2 = module
+    return _EMS_GRPC_PB2
 
-            spec = importlib.util.spec_from_file_location(module_name, module_path)
-            self._ems_grpc_pb2 = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(self._ems_grpc_pb2)
-        elif sys.version_info[0] == 3 and sys.version_info[1] < 5:
-            import importlib.machinery
 
-            loader = importlib.machinery.SourceFileLoader(module_name, module_path)
-            self._ems_grpc_pb2 = loader.load_module()
-        elif sys.version_info[0] == 2:
-            import imp
+class Grpc(GrpcBase):
+    def __init__(self, connection):
+        super(Grpc, self).__init__(connection)
+        self._ems_grpc_pb2 = load_ems_grpc_pb2()
+        self._stubs = {}
+        self._stubs_channel = None
 
-            self._ems_grpc_pb2 = imp.load_source(module_name, module_path)
+    def _stub(self, service):
+        """Returns the beta stub of service, the stubs are reused
+        for as long as the connection keeps the same channel
 
-    def get_config(self, section=None):
-        stub = self._ems_grpc_pb2.beta_create_gRPCConfigOper_stub(
-            self._connection._channel,
-        )
+        :param service: gRPCConfigOper or gRPCExec
+        """
+        channel = self._connection._channel
+        if channel is not self._stubs_channel:
+            self._stubs = {}
+            self._stubs_channel = channel
+        if service not in self._stubs:
+            factory = getattr(self._ems_grpc_pb2, "beta_create_%s_stub" % service)
+            self._stubs[service] = factory(channel)
+        return self._stubs[service]
+
+    def _join_replies(self, responses, field, dest=None):
+        """Collects the data and errors of streamed replies, the chunks
+        are joined once instead of concatenated reply by reply
+
+        :param responses: the streamed replies
+        :param field: the reply field that holds the data
+        :param dest: path of a local file the data is written to
+                     instead of being returned
+        :rtype: dict
+        :returns: response and error, dest and error when
+                  the data has been written to dest
+        """
+        errors = []
+        if dest is None:
+            chunks = []
+            for response in responses:
+                chunks.append(getattr(response, field))
+                errors.append(response.errors)
+            return {"response": "".join(chunks), "error": "".join(errors)}
+
+        with open(dest, "w") as f:
+            for response in responses:
+                f.write(getattr(response, field))
+                errors.append(response.errors)
+        return {"dest": dest, "error": "".join(errors)}
+
+    def _iter_replies(self, responses, field):
+        for response in responses:
+            yield {"response": getattr(response, field), "error": response.errors}
+
+    def _get_config_replies(self, section=None):
+        stub = self._stub("gRPCConfigOper")
         message = self._ems_grpc_pb2.ConfigGetArgs(yangpathjson=section)
-        responses = stub.GetConfig(
+        return stub.GetConfig(
             message,
             self._connection._timeout,
             metadata=self._connection._login_credentials,
         )
-        output = {"response": "", "error": ""}
-        for response in responses:
-            output["response"] += response.yangjson
-            output["error"] += response.errors
-        return output
 
-    def get(self, section=None):
-        stub = self._ems_grpc_pb2.beta_create_gRPCConfigOper_stub(
-            self._connection._channel,
-        )
+    def _get_replies(self, section=None):
+        stub = self._stub("gRPCConfigOper")
         message = self._ems_grpc_pb2.GetOperArgs(yangpathjson=section)
-        responses = stub.GetOper(
+        return stub.GetOper(
             message,
             self._connection._timeout,
             metadata=self._connection._login_credentials,
         )
-        output = {"response": "", "error": ""}
-        for response in responses:
-            output["response"] += response.yangjson
-            output["error"] += response.errors
-        return output
+
+    def get_config(self, section=None, dest=None):
+        return self._join_replies(self._get_config_replies(section), "yangjson", dest)
+
+    def get(self, section=None, dest=None):
+        return self._join_replies(self._get_replies(section), "yangjson", dest)
+
+    @ensure_connect
+    def get_batch(self, sections, max_workers=None):
+        """Issues one GetOper per section concurrently over the
+        connection channel and waits for all of them
+
+        :param sections: list of yangpathjson
+        :param max_workers: maximum number of calls in flight,
+                            GET_BATCH_WORKERS by default
+        :rtype: dict
+        :returns: the get() output of each section
+        """
+        sections = list(sections)
+        if not sections:
+            return {}
+        # create the stub before the calls share it
+        self._stub("gRPCConfigOper")
+        max_workers = min(len(sections), max_workers or GET_BATCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(section, executor.submit(self.get, section)) for section in sections]
+            return dict((section, future.result()) for section, future in futures)
+
+    # the _iter_* generators are for callers within the connection
+    # process, JSON-RPC can not return a generator to a module
+    def _iter_config(self, section=None):
+        """Yields the response and error of each GetConfig reply
+        as it is received, without keeping the whole config in memory
+        """
+        return self._iter_replies(self._get_config_replies(section), "yangjson")
+
+    def _iter_oper(self, section=None):
+        """Yields the response and error of each GetOper reply
+        as it is received, without keeping the whole tree in memory
+        """
+        return self._iter_replies(self._get_replies(section), "yangjson")
 
     @ensure_connect
     def merge_config(self, path):
@@ -92,9 +191,7 @@ class Grpc(GrpcBase):
         :rtype: Response object
         """
         path = json.dumps(path)
-        stub = self._ems_grpc_pb2.beta_create_gRPCConfigOper_stub(
-            self._connection._channel,
-        )
+        stub = self._stub("gRPCConfigOper")
         message = self._ems_grpc_pb2.ConfigArgs(yangjson=path)
         response = stub.MergeConfig(
             message,
@@ -115,9 +212,7 @@ class Grpc(GrpcBase):
         :rtype: Response object
         """
         path = json.dumps(path)
-        stub = self._ems_grpc_pb2.beta_create_gRPCConfigOper_stub(
-            self._connection._channel,
-        )
+        stub = self._stub("gRPCConfigOper")
         message = self._ems_grpc_pb2.ConfigArgs(yangjson=path)
         response = stub.ReplaceConfig(
             message,
@@ -138,9 +233,7 @@ class Grpc(GrpcBase):
         :rtype: Response object
         """
         path = json.dumps(path)
-        stub = self._ems_grpc_pb2.beta_create_gRPCConfigOper_stub(
-            self._connection._channel,
-        )
+        stub = self._stub("gRPCConfigOper")
         message = self._ems_grpc_pb2.ConfigArgs(yangjson=path)
         response = stub.DeleteConfig(
             message,
@@ -153,15 +246,143 @@ class Grpc(GrpcBase):
             return None
 
     @ensure_connect
-    def run_cli(self, command=None, display=None):
-        if command is None:
-            raise ValueError("command value must be provided")
+    def edit_config(self, candidate=None, commit=True, comment=None, label=None):
+        """Loads the config lines into the candidate config with one
+        CliConfig call and commits them with one CommitConfig call
 
-        output = {"response": "", "error": ""}
-        stub = self._ems_grpc_pb2.beta_create_gRPCExec_stub(
-            self._connection._channel,
+        :param candidate: config lines, either str or dict with command
+        :param commit: commit the candidate config, else discard it
+        :param comment: commit comment
+        :param label: commit label
+        :rtype: dict
+        :returns: request, the config lines, and response,
+                  the commit result
+        """
+        requests = []
+        for line in to_list(candidate):
+            if isinstance(line, Mapping):
+                line = line["command"]
+            requests.append(line)
+
+        resp = {"request": requests, "response": None}
+        if not requests:
+            return resp
+
+        stub = self._stub("gRPCConfigOper")
+        message = self._ems_grpc_pb2.CliConfigArgs(cli="\n".join(requests))
+        response = stub.CliConfig(
+            message,
+            self._connection._timeout,
+            metadata=self._connection._login_credentials,
         )
+        if response and response.errors:
+            self.discard_changes()
+            raise ConnectionError(to_text(response.errors, errors="surrogate_or_strict"))
 
+        if commit:
+            resp["response"] = self.commit(comment=comment, label=label)
+        else:
+            self.discard_changes()
+        return resp
+
+    @ensure_connect
+    def commit(self, comment=None, label=None):
+        """Commits the candidate config with CommitConfig
+
+        :param comment: commit comment
+        :param label: commit label
+        :returns: the commit result, CHANGE or NO_CHANGE
+        """
+        stub = self._stub("gRPCConfigOper")
+        msg = self._ems_grpc_pb2.CommitMsg(label=label or "", comment=comment or "")
+        message = self._ems_grpc_pb2.CommitArgs(msg=msg)
+        response = stub.CommitConfig(
+            message,
+            self._connection._timeout,
+            metadata=self._connection._login_credentials,
+        )
+        if response.errors or response.result == self._ems_grpc_pb2.FAIL:
+            raise ConnectionError(
+                to_text(response.errors or "commit failed", errors="surrogate_or_strict"),
+            )
+        return self._ems_grpc_pb2.CommitResult.Name(response.result)
+
+    @ensure_connect
+    def discard_changes(self):
+        """Discards the candidate config with ConfigDiscardChanges"""
+        stub = self._stub("gRPCConfigOper")
+        message = self._ems_grpc_pb2.DiscardChangesArgs()
+        response = stub.ConfigDiscardChanges(
+            message,
+            self._connection._timeout,
+            metadata=self._connection._login_credentials,
+        )
+        if response and response.errors:
+            raise ConnectionError(to_text(response.errors, errors="surrogate_or_strict"))
+
+    @ensure_connect
+    def subscribe(self, subscription, encoding="json", timeout=None, count=None):
+        """Opens a CreateSubs stream for a telemetry subscription
+        configured on the device and collects its messages
+
+        :param subscription: the telemetry subscription id
+        :param encoding: json, gpb or gpbkv, json messages are
+                         decoded, the others are returned as bytes
+        :param timeout: seconds after which the stream ends,
+                        the connection timeout by default
+        :param count: number of messages after which the stream ends
+        :rtype: list
+        :returns: the messages received until the stream ended
+        """
+        return list(self._iter_subscription(subscription, encoding, timeout, count))
+
+    def _iter_subscription(self, subscription, encoding="json", timeout=None, count=None):
+        """Yields the messages of a CreateSubs stream as they are
+        received, see subscribe() for the parameters
+        """
+        if encoding not in TELEMETRY_ENCODINGS:
+            raise ValueError(
+                "encoding must be one of %s" % ", ".join(sorted(TELEMETRY_ENCODINGS)),
+            )
+        stub = self._stub("gRPCConfigOper")
+        message = self._ems_grpc_pb2.CreateSubsArgs(
+            encode=TELEMETRY_ENCODINGS[encoding],
+            subidstr=str(subscription),
+        )
+        responses = stub.CreateSubs(
+            message,
+            timeout or self._connection._timeout,
+            metadata=self._connection._login_credentials,
+        )
+        received = 0
+        try:
+            for response in responses:
+                if response.errors:
+                    raise ConnectionError(to_text(response.errors, errors="surrogate_or_strict"))
+                if encoding == "json":
+                    data = to_text(response.data, errors="surrogate_or_strict")
+                    try:
+                        yield json.loads(data)
+                    except ValueError:
+                        yield data
+                else:
+                    yield response.data
+                received += 1
+                if count and received >= count:
+                    break
+        except Exception as exc:
+            if not _deadline_exceeded(exc):
+                raise
+        finally:
+            cancel = getattr(responses, "cancel", None)
+            if cancel is not None:
+                cancel()
+
+    def _run_cli_replies(self, command, display=None):
+        if command is None:
+            raise ValueError("command value must be provided")
+
+        stub = self._stub("gRPCExec")
         message = self._ems_grpc_pb2.ShowCmdArgs(cli=command)
         if display == "text":
             responses = stub.ShowCmdTextOutput(
@@ -169,19 +390,26 @@ class Grpc(GrpcBase):
                 self._connection._timeout,
                 metadata=self._connection._login_credentials,
             )
-            for response in responses:
-                output["response"] += response.output
-                output["error"] += response.errors
-        else:
-            responses = stub.ShowCmdJSONOutput(
-                message,
-                self._connection._timeout,
-                metadata=self._connection._login_credentials,
-            )
-            for response in responses:
-                output["response"] += response.jsonoutput
-                output["error"] += response.errors
-        return output
+            return responses, "output"
+        responses = stub.ShowCmdJSONOutput(
+            message,
+            self._connection._timeout,
+            metadata=self._connection._login_credentials,
+        )
+        return responses, "jsonoutput"
+
+    @ensure_connect
+    def run_cli(self, command=None, display=None, dest=None):
+        responses, field = self._run_cli_replies(command, display)
+        return self._join_replies(responses, field, dest)
+
+    @ensure_connect
+    def _iter_cli(self, command=None, display=None):
+        """Yields the response and error of each show command reply
+        as it is received
+        """
+        responses, field = self._run_cli_replies(command, display)
+        return self._iter_replies(responses, field)
 
     @property
     def server_capabilities(self):
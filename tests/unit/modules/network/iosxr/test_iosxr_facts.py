@@ -22,7 +22,12 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import json
+import os
+import subprocess
+import sys
 
+from statistics import median
+from unittest import skipUnless
 from unittest.mock import patch
 
 from ansible_collections.cisco.iosxr.plugins.modules import iosxr_facts
@@ -148,3 +153,101 @@ class TestIosxrFacts(TestIosxrModule):
             ],
         }
         self.assertCountEqual(ansible_facts.keys(), expected_neighbors.keys())
+
+    def test_iosxr_facts_resources_share_running_config(self):
+        connection = self.get_resource_connection.return_value
+        connection.get_config.return_value = load_fixture("show_running-config")
+        set_module_args(
+            dict(
+                gather_subset="min",
+                gather_network_resources=["hostname", "interfaces", "vrf_global"],
+            ),
+        )
+        result = self.execute_module()
+        connection.get_config.assert_called_once_with()
+        connection.get.assert_not_called()
+        resources = result["ansible_facts"]["ansible_network_resources"]
+        self.assertEqual(resources["hostname"], {"hostname": "iosxr01"})
+        self.assertEqual(resources["vrf_global"], [{"name": "Mgmt-intf"}])
+        self.assertEqual(
+            [intf["name"] for intf in resources["interfaces"]],
+            ["Loopback0", "GigabitEthernet0/0/0/0"],
+        )
+
+    def test_iosxr_facts_resources_from_yang_over_grpc(self):
+        connection = self.get_resource_connection.return_value
+
+        def get_resource_connection(module):
+            module._capabilities = {"network_api": "ansible.netcommon.grpc"}
+            return connection
+
+        def get_config(section):
+            self.assertIn("Cisco-IOS-XR-ifmgr-cfg:interface-configurations", json.loads(section))
+            yang = load_fixture("iosxr_interface_config_yang.json")
+            return {"response": json.dumps(yang), "error": ""}
+
+        self.get_resource_connection.side_effect = get_resource_connection
+        connection.get_config.side_effect = get_config
+        set_module_args(dict(gather_subset="min", gather_network_resources="interfaces"))
+        result = self.execute_module()
+        resources = result["ansible_facts"]["ansible_network_resources"]
+        self.assertEqual(
+            [intf["mtu"] for intf in resources["interfaces"]],
+            [110, 2800],
+        )
+        connection.get_config.assert_called_once()
+
+    def run_python(self, code):
+        # a fresh interpreter, the test run has already imported every resource
+        return subprocess.check_output(
+            [sys.executable, "-c", "\n".join(code)],
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+            universal_newlines=True,
+        )
+
+    def test_iosxr_facts_resource_classes_loaded_on_demand(self):
+        output = self.run_python(
+            (
+                "import sys",
+                "from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts"
+                ".facts import FACT_RESOURCE_SUBSETS",
+                "FACT_RESOURCE_SUBSETS['hostname']",
+                "prefix = 'ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.'",
+                "print(' '.join(sorted(m[len(prefix):] for m in sys.modules if m.startswith(prefix))))",
+                "print(len(FACT_RESOURCE_SUBSETS), 'bgp_global' in FACT_RESOURCE_SUBSETS)",
+            ),
+        )
+        loaded, resources = output.splitlines()
+        loaded = loaded.split()
+        for name in ("facts.hostname.hostname", "rm_templates.hostname"):
+            self.assertIn(name, loaded)
+        for resource in ("bgp_global", "interfaces", "static_routes"):
+            for package in ("argspec", "facts", "rm_templates"):
+                self.assertNotIn("%s.%s" % (package, resource), loaded)
+        self.assertEqual(resources, "27 True")
+
+    @skipUnless(os.environ.get("IOSXR_BENCHMARK"), "set IOSXR_BENCHMARK=1 to run")
+    def test_iosxr_facts_startup_benchmark(self):
+        """Median startup of a module gathering one resource, with the
+        resource facts classes loaded on demand and all of them loaded
+        upfront as before, in fresh interpreters
+        """
+        code = [
+            "import time",
+            "start = time.perf_counter()",
+            "from ansible_collections.cisco.iosxr.plugins.modules import iosxr_hostname",
+            "from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts"
+            ".facts import FACT_RESOURCE_SUBSETS",
+            "FACT_RESOURCE_SUBSETS['hostname']",
+            "print(time.perf_counter() - start)",
+        ]
+        eager = code[:-1] + ["[FACT_RESOURCE_SUBSETS[key] for key in FACT_RESOURCE_SUBSETS]"]
+        eager.append(code[-1])
+        runs = int(os.environ.get("IOSXR_BENCHMARK_RUNS", 15))
+        on_demand = median(float(self.run_python(code)) for dummy in range(runs))
+        upfront = median(float(self.run_python(eager)) for dummy in range(runs))
+        print(
+            "\niosxr_hostname startup: %.1f ms on demand, %.1f ms upfront"
+            % (on_demand * 1000, upfront * 1000),
+        )
+        self.assertLess(on_demand, upfront)
@@ -0,0 +1,331 @@
+#
+# (c) 2026, Ansible by Red Hat, inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+
+from unittest import TestCase, skipUnless
+from unittest.mock import MagicMock, patch
+
+from ansible.module_utils._text import to_bytes
+from ansible.module_utils.connection import ConnectionError
+from ansible.utils.jsonrpc import JsonRpcServer
+
+from ansible_collections.cisco.iosxr.plugins.sub_plugins.grpc import iosxr
+
+
+try:
+    import grpc
+
+    from google import protobuf  # noqa: F401
+
+    HAS_GRPC = True
+except ImportError:
+    HAS_GRPC = False
+
+
+class Reply(object):
+    def __init__(self, **kwargs):
+        self.errors = ""
+        self.__dict__.update(kwargs)
+
+
+class Stream(object):
+    """A reply stream that ends with an error"""
+
+    def __init__(self, replies, error=None):
+        self.replies = iter(replies)
+        self.error = error
+        self.cancelled = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        for reply in self.replies:
+            return reply
+        if self.error:
+            raise self.error
+        raise StopIteration
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class ExpirationError(Exception):
+    pass
+
+
+def rpc(plugin, method, *args, **kwargs):
+    """Calls a plugin method the way a module does, over JSON-RPC"""
+    server = JsonRpcServer()
+    server.register(plugin)
+    request = {"jsonrpc": "2.0", "method": method, "params": (args, kwargs), "id": 1}
+    try:
+        response = json.loads(server.handle_request(json.dumps(request)))
+    finally:
+        # the registered objects are shared by all the servers
+        server._objects.discard(plugin)
+    if "error" in response:
+        raise ConnectionError(response["error"].get("data") or response["error"]["message"])
+    if response.get("result_type") == "pickle":
+        return pickle.loads(to_bytes(response["result"], errors="surrogate_then_replace"))
+    return response["result"]
+
+
+class TestIosxrGrpc(TestCase):
+    def setUp(self):
+        self.pb2 = MagicMock()
+        self.mock_pb2 = patch.object(iosxr, "_EMS_GRPC_PB2", self.pb2)
+        self.mock_pb2.start()
+        self.connection = MagicMock(_connected=True, _timeout=30)
+        self.grpc = iosxr.Grpc(self.connection)
+        self.config_stub = self.pb2.beta_create_gRPCConfigOper_stub.return_value
+        self.exec_stub = self.pb2.beta_create_gRPCExec_stub.return_value
+
+        self.pb2.CHANGE, self.pb2.NO_CHANGE, self.pb2.FAIL = 0, 1, 2
+        self.pb2.CommitResult.Name.side_effect = ["CHANGE", "NO_CHANGE", "FAIL"].__getitem__
+
+    def tearDown(self):
+        self.mock_pb2.stop()
+
+    def test_grpc_pb2_loaded_once(self):
+        self.assertIs(iosxr.load_ems_grpc_pb2(), self.pb2)
+        self.assertIs(iosxr.Grpc(self.connection)._ems_grpc_pb2, self.pb2)
+
+    def test_grpc_stubs_reused(self):
+        self.config_stub.GetConfig.return_value = [Reply(yangjson="{}")]
+        self.config_stub.GetOper.return_value = [Reply(yangjson="{}")]
+        self.exec_stub.ShowCmdTextOutput.return_value = [Reply(output="ok")]
+        self.grpc.get_config()
+        self.grpc.get()
+        self.grpc.run_cli("show version", display="text")
+        self.grpc.run_cli("show version", display="text")
+        self.pb2.beta_create_gRPCConfigOper_stub.assert_called_once_with(
+            self.connection._channel,
+        )
+        self.pb2.beta_create_gRPCExec_stub.assert_called_once_with(self.connection._channel)
+
+        # a new channel after a reconnect gets new stubs
+        self.connection._channel = MagicMock()
+        self.grpc.get_config()
+        self.pb2.beta_create_gRPCConfigOper_stub.assert_called_with(self.connection._channel)
+        self.assertEqual(self.pb2.beta_create_gRPCConfigOper_stub.call_count, 2)
+
+    def test_grpc_replies_joined(self):
+        self.config_stub.GetOper.return_value = [
+            Reply(yangjson='{"a": '),
+            Reply(yangjson="1}", errors="warning"),
+        ]
+        self.assertEqual(self.grpc.get("{}"), {"response": '{"a": 1}', "error": "warning"})
+        self.exec_stub.ShowCmdJSONOutput.return_value = [
+            Reply(jsonoutput="{"),
+            Reply(jsonoutput="}"),
+        ]
+        self.assertEqual(self.grpc.run_cli("show version"), {"response": "{}", "error": ""})
+        with self.assertRaises(ValueError):
+            self.grpc.run_cli()
+
+    def test_grpc_replies_to_dest(self):
+        self.config_stub.GetConfig.return_value = [Reply(yangjson='{"a": '), Reply(yangjson="1}")]
+        fd, dest = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, dest)
+        self.assertEqual(self.grpc.get_config(dest=dest), {"dest": dest, "error": ""})
+        with open(dest) as f:
+            self.assertEqual(f.read(), '{"a": 1}')
+
+    def test_grpc_replies_iterated(self):
+        self.config_stub.GetOper.return_value = iter([Reply(yangjson="{"), Reply(yangjson="}")])
+        self.assertEqual(
+            list(self.grpc._iter_oper("{}")),
+            [{"response": "{", "error": ""}, {"response": "}", "error": ""}],
+        )
+        self.exec_stub.ShowCmdTextOutput.return_value = [Reply(output="ok")]
+        self.assertEqual(
+            list(self.grpc._iter_cli("show clock", display="text")),
+            [{"response": "ok", "error": ""}],
+        )
+
+        # generators can not be returned over JSON-RPC
+        for method in ("iter_config", "iter_oper", "iter_cli"):
+            with self.assertRaises(ConnectionError):
+                rpc(self.grpc, method)
+        self.exec_stub.ShowCmdTextOutput.return_value = [Reply(output="ok")]
+        self.assertEqual(
+            rpc(self.grpc, "run_cli", "show clock", display="text"),
+            {"response": "ok", "error": ""},
+        )
+
+    def test_grpc_get_batch(self):
+        paths = ['{"a": null}', '{"b": null}', '{"c": null}']
+        barrier = threading.Barrier(len(paths), timeout=10)
+
+        def get_oper(message, timeout, metadata=None):
+            # only returns once all the calls are in flight
+            barrier.wait()
+            return [Reply(yangjson=message.yangpathjson)]
+
+        self.pb2.GetOperArgs.side_effect = lambda yangpathjson: MagicMock(
+            yangpathjson=yangpathjson,
+        )
+        self.config_stub.GetOper.side_effect = get_oper
+        self.assertEqual(
+            self.grpc.get_batch(paths),
+            dict((path, {"response": path, "error": ""}) for path in paths),
+        )
+        self.pb2.beta_create_gRPCConfigOper_stub.assert_called_once_with(
+            self.connection._channel,
+        )
+        self.assertEqual(self.grpc.get_batch([]), {})
+
+    def test_grpc_get_batch_bounded(self):
+        paths = ['{"path%d": null}' % idx for idx in range(20)]
+        lock = threading.Lock()
+        calls = {"active": 0, "max": 0}
+
+        def get_oper(message, timeout, metadata=None):
+            with lock:
+                calls["active"] += 1
+                calls["max"] = max(calls["max"], calls["active"])
+            time.sleep(0.01)
+            with lock:
+                calls["active"] -= 1
+            return [Reply(yangjson="{}")]
+
+        self.config_stub.GetOper.side_effect = get_oper
+        self.assertEqual(len(self.grpc.get_batch(paths)), 20)
+        self.assertLessEqual(calls["max"], iosxr.GET_BATCH_WORKERS)
+        calls["max"] = 0
+        self.grpc.get_batch(paths, max_workers=2)
+        self.assertLessEqual(calls["max"], 2)
+
+    def test_grpc_edit_config(self):
+        self.config_stub.CliConfig.return_value = Reply()
+        self.config_stub.CommitConfig.return_value = Reply(result=0)
+        self.config_stub.ConfigDiscardChanges.return_value = Reply()
+        commands = ["interface Loopback0", {"command": " description test"}]
+        self.assertEqual(
+            self.grpc.edit_config(commands, comment="test"),
+            {"request": ["interface Loopback0", " description test"], "response": "CHANGE"},
+        )
+        self.pb2.CliConfigArgs.assert_called_once_with(cli="interface Loopback0\n description test")
+        self.config_stub.CliConfig.assert_called_once()
+        self.pb2.CommitMsg.assert_called_once_with(label="", comment="test")
+        self.config_stub.CommitConfig.assert_called_once()
+        self.config_stub.ConfigDiscardChanges.assert_not_called()
+
+        self.assertEqual(self.grpc.edit_config(candidate=[]), {"request": [], "response": None})
+        self.assertEqual(self.config_stub.CliConfig.call_count, 1)
+
+        self.grpc.edit_config(commands, commit=False)
+        self.assertEqual(self.config_stub.CommitConfig.call_count, 1)
+        self.config_stub.ConfigDiscardChanges.assert_called_once()
+
+    def test_grpc_edit_config_errors(self):
+        self.config_stub.ConfigDiscardChanges.return_value = Reply()
+        self.config_stub.CliConfig.return_value = Reply(errors="invalid input")
+        with self.assertRaises(ConnectionError) as exc:
+            self.grpc.edit_config(["interface Loopback0"])
+        self.assertEqual(str(exc.exception), "invalid input")
+        self.config_stub.ConfigDiscardChanges.assert_called_once()
+        self.config_stub.CommitConfig.assert_not_called()
+
+        self.config_stub.CliConfig.return_value = Reply()
+        self.config_stub.CommitConfig.return_value = Reply(result=2)
+        with self.assertRaises(ConnectionError):
+            self.grpc.edit_config(["interface Loopback0"])
+
+    def test_grpc_subscribe(self):
+        messages = [{"node_id_str": "xr", "collection_id": str(i)} for i in range(5)]
+        stream = Stream([Reply(data=json.dumps(msg).encode()) for msg in messages])
+        self.config_stub.CreateSubs.return_value = stream
+        self.assertEqual(self.grpc.subscribe("sub1", count=2), messages[:2])
+        self.pb2.CreateSubsArgs.assert_called_once_with(encode=4, subidstr="sub1")
+        self.assertEqual(self.config_stub.CreateSubs.call_args[0][1], 30)
+        self.assertTrue(stream.cancelled)
+
+        self.config_stub.CreateSubs.return_value = Stream([Reply(data=b"\x08\x01")])
+        self.assertEqual(self.grpc.subscribe("sub1", encoding="gpbkv", timeout=5), [b"\x08\x01"])
+        self.pb2.CreateSubsArgs.assert_called_with(encode=3, subidstr="sub1")
+        self.assertEqual(self.config_stub.CreateSubs.call_args[0][1], 5)
+
+        with self.assertRaises(ValueError):
+            self.grpc.subscribe("sub1", encoding="xml")
+
+        # modules call it over JSON-RPC
+        self.config_stub.CreateSubs.return_value = Stream(
+            [Reply(data=json.dumps(msg).encode()) for msg in messages],
+        )
+        self.assertEqual(rpc(self.grpc, "subscribe", "sub1", count=3), messages[:3])
+        self.config_stub.CreateSubs.return_value = Stream([Reply(data=b"\x08\x01")])
+        self.assertEqual(rpc(self.grpc, "subscribe", "sub1", encoding="gpb"), [b"\x08\x01"])
+
+    def test_grpc_subscribe_stream_end(self):
+        # the stream ends at its deadline
+        stream = Stream([Reply(data=b"{}")], ExpirationError())
+        self.config_stub.CreateSubs.return_value = stream
+        self.assertEqual(self.grpc.subscribe("sub1", timeout=1), [{}])
+        self.assertTrue(stream.cancelled)
+
+        self.config_stub.CreateSubs.return_value = Stream([], RuntimeError("connection lost"))
+        with self.assertRaises(RuntimeError):
+            self.grpc.subscribe("sub1")
+
+        self.config_stub.CreateSubs.return_value = Stream([Reply(data=b"", errors="no sub1")])
+        with self.assertRaises(ConnectionError):
+            self.grpc.subscribe("sub1")
+
+
+@skipUnless(HAS_GRPC, "grpcio and protobuf are required")
+class TestIosxrGrpcServer(TestCase):
+    """Runs the subscription against a local gRPC server"""
+
+    def setUp(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from grpc.beta import implementations
+
+        pb2 = iosxr.load_ems_grpc_pb2()
+        test = self
+
+        class Servicer(pb2.gRPCConfigOperServicer):
+            def CreateSubs(self, request, context):
+                test.request = request
+                for idx in range(3):
+                    data = json.dumps({"subscription": request.subidstr, "idx": idx})
+                    yield pb2.CreateSubsReply(data=data.encode())
+
+        self.server = grpc.server(ThreadPoolExecutor(max_workers=2))
+        pb2.add_gRPCConfigOperServicer_to_server(Servicer(), self.server)
+        port = self.server.add_insecure_port("127.0.0.1:0")
+        self.server.start()
+        channel = implementations.Channel(grpc.insecure_channel("127.0.0.1:%d" % port))
+        self.connection = MagicMock(
+            _connected=True,
+            _timeout=10,
+            _channel=channel,
+            _login_credentials=[("username", "admin"), ("password", "admin")],
+        )
+
+    def tearDown(self):
+        self.server.stop(None)
+
+    def test_grpc_subscribe_server(self):
+        messages = iosxr.Grpc(self.connection).subscribe("sub1", count=2)
+        self.assertEqual(messages, [{"subscription": "sub1", "idx": idx} for idx in range(2)])
+        self.assertEqual(self.request.encode, 4)
+
+        messages = rpc(iosxr.Grpc(self.connection), "subscribe", "sub1")
+        self.assertEqual(len(messages), 3)
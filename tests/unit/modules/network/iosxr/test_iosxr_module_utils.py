@@ -0,0 +1,229 @@
+#
+# (c) 2026, Ansible by Red Hat, inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from collections import OrderedDict
+from unittest import TestCase, skipUnless
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr import iosxr
+
+
+INTERFACE = (
+    "<interface-configuration><active>act</active><interface-name>%s</interface-name>"
+    "<description>%s</description></interface-configuration>"
+)
+
+
+def config_reply(*interfaces):
+    return (
+        "<rpc-reply><data>"
+        '<interface-configurations xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-ifmgr-cfg">'
+        "%s</interface-configurations></data></rpc-reply>"
+    ) % "".join(INTERFACE % intf for intf in interfaces)
+
+
+@skipUnless(iosxr.HAS_XML, "lxml is required")
+class TestIosxrConfigDiff(TestCase):
+    def setUp(self):
+        self.module = MagicMock()
+        for name, value in (
+            ("get_connection", MagicMock()),
+            ("is_cliconf", MagicMock(return_value=False)),
+            ("is_netconf", MagicMock(return_value=True)),
+        ):
+            mock = patch.object(iosxr, name, value)
+            mock.start()
+            self.addCleanup(mock.stop)
+
+    def get_config_diff(self, running, candidate):
+        return iosxr.get_config_diff(self.module, running, candidate)
+
+    def changes(self, running, candidate):
+        running = iosxr.etree.fromstring(running)[0]
+        candidate = iosxr.etree.fromstring(candidate)[0]
+        return [
+            (op, path, iosxr.etree.QName(ele).localname, ele.text)
+            for op, path, ele in iosxr.iter_config_diff(running, candidate)
+        ]
+
+    def test_config_diff_unchanged(self):
+        running = config_reply(("Gi0/0/0/0", "a"), ("Gi0/0/0/1", "b"))
+        self.assertIsNone(self.get_config_diff(running, running))
+        # list entries moved around are not a change
+        candidate = config_reply(("Gi0/0/0/1", "b"), ("Gi0/0/0/0", "a"))
+        self.assertIsNone(self.get_config_diff(running, candidate))
+
+    def test_config_diff_changes(self):
+        running = config_reply(("Gi0/0/0/0", "a"), ("Gi0/0/0/1", "b"), ("Gi0/0/0/2", "c"))
+        candidate = config_reply(("Gi0/0/0/2", "c"), ("Gi0/0/0/1", "new"), ("Lo0", "lo"))
+        entry = "/interface-configurations/interface-configuration[active=act][interface-name=%s]"
+        self.assertEqual(
+            self.changes(running, candidate),
+            [
+                ("-", entry % "Gi0/0/0/0", "interface-configuration", None),
+                ("-", entry % "Gi0/0/0/1" + "/description", "description", "b"),
+                ("+", entry % "Gi0/0/0/1" + "/description", "description", "new"),
+                ("+", entry % "Lo0", "interface-configuration", None),
+            ],
+        )
+        diff = self.get_config_diff(running, candidate).splitlines()
+        self.assertEqual(diff[0], "- " + entry % "Gi0/0/0/0")
+        self.assertTrue(diff[1].startswith("-   <interface-configuration"))
+        self.assertEqual(diff[4], "+ " + entry % "Gi0/0/0/1" + "/description")
+        self.assertIn("new</description>", diff[5])
+
+    def test_config_diff_entries_by_position(self):
+        # entries that no leading leaves tell apart are matched in order
+        running = "<rpc-reply><data><a><b><c><d>1</d></c></b><b><c><d>2</d></c></b></a></data></rpc-reply>"
+        candidate = "<rpc-reply><data><a><b><c><d>1</d></c></b><b><c><d>3</d></c></b></a></data></rpc-reply>"
+        self.assertEqual(
+            self.changes(running, candidate),
+            [("-", "/a/b[2]/c/d", "d", "2"), ("+", "/a/b[2]/c/d", "d", "3")],
+        )
+
+    def test_config_diff_deep_change(self):
+        # subtrees are digested once, not serialized at every level
+        depth = 30
+        running = "<rpc-reply><data>%s<v>1</v>%s</data></rpc-reply>" % (
+            "<a><b>x</b>" * depth,
+            "</a>" * depth,
+        )
+        candidate = running.replace(">1<", ">2<")
+        with patch.object(iosxr.etree, "tostring", side_effect=AssertionError):
+            changes = self.changes(running, candidate)
+        path = "/a" * depth + "/v"
+        self.assertEqual(changes, [("-", path, "v", "1"), ("+", path, "v", "2")])
+        self.assertEqual(self.changes(running, running), [])
+
+    def test_load_config_netconf_diff(self):
+        conn = iosxr.get_connection.return_value
+        running = config_reply(("Gi0/0/0/0", "a"))
+        with patch.object(iosxr, "get_config") as get_config:
+            get_config.return_value = config_reply(("Gi0/0/0/0", "a"))
+            self.assertIsNone(iosxr.load_config(self.module, "<config/>", True, running=running))
+            conn.discard_changes.assert_called_once_with(remove_ns=True)
+            conn.commit.assert_not_called()
+
+            get_config.return_value = config_reply(("Gi0/0/0/0", "b"))
+            self.assertTrue(iosxr.load_config(self.module, "<config/>", True, running=running))
+            conn.commit.assert_called_once()
+
+    def test_load_config_netconf_batched(self):
+        conn = iosxr.get_connection.return_value
+        filters = [
+            '<config xmlns:xc="urn:ietf:params:xml:ns:netconf:base:1.0"><a xmlns="urn:a"/></config>',
+            '<config xmlns:xc="urn:ietf:params:xml:ns:netconf:base:1.0"><b xmlns="urn:b"/></config>',
+        ]
+        running = config_reply(("Gi0/0/0/0", "a"))
+        with patch.object(iosxr, "get_config", return_value=config_reply(("Gi0/0/0/0", "b"))):
+            self.assertTrue(iosxr.load_config(self.module, filters, True, running=running))
+        conn.edit_config.assert_called_once_with(
+            config='<config xmlns:xc="urn:ietf:params:xml:ns:netconf:base:1.0">'
+            '<a xmlns="urn:a"/><b xmlns="urn:b"/></config>',
+            remove_ns=True,
+        )
+        conn.lock.assert_called_once_with(target="candidate")
+        conn.unlock.assert_called_once_with(target="candidate")
+        self.assertEqual(iosxr.build_edit_config(filters[:1]), filters[0])
+
+    def test_load_config_netconf_without_running(self):
+        conn = iosxr.get_connection.return_value
+        # nothing to diff the candidate with, it is discarded
+        with patch.object(iosxr, "get_config") as get_config:
+            self.assertIsNone(iosxr.load_config(self.module, "<config/>", True))
+            get_config.assert_not_called()
+        conn.commit.assert_not_called()
+        conn.discard_changes.assert_called_once_with(remove_ns=True)
+        conn.unlock.assert_called_once_with(target="candidate")
+
+    def test_load_config_netconf_unlock_on_error(self):
+        conn = iosxr.get_connection.return_value
+        conn.edit_config.side_effect = iosxr.ConnectionError("invalid config")
+        iosxr.load_config(self.module, "<config/>", True)
+        self.module.fail_json.assert_called_once_with(msg="invalid config")
+        conn.unlock.assert_called_once_with(target="candidate")
+
+
+@skipUnless(iosxr.HAS_XML, "lxml is required")
+class TestIosxrBuildXml(TestCase):
+    def setUp(self):
+        self.xmap = OrderedDict(
+            [
+                ("aaa_locald", {"xpath": "aaa/usernames", "tag": True, "ns": True}),
+                (
+                    "username",
+                    {"xpath": "aaa/usernames/username", "tag": True, "attrib": "operation"},
+                ),
+                ("a:name", {"xpath": "aaa/usernames/username/name"}),
+                (
+                    "secret",
+                    {"xpath": "aaa/usernames/username/secret", "tag": True, "operation": "edit"},
+                ),
+                (
+                    "a:configured_password",
+                    {"xpath": "aaa/usernames/username/secret/secret5", "operation": "edit"},
+                ),
+            ],
+        )
+
+    def test_build_xml(self):
+        users = [{"name": "ansible1", "configured_password": "p1"}, {"name": "ansible2"}]
+        self.assertEqual(
+            iosxr.build_xml("aaa", xmap=self.xmap, params=users, opcode="merge"),
+            '<config xmlns:xc="urn:ietf:params:xml:ns:netconf:base:1.0">'
+            '<aaa xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-aaa-lib-cfg">'
+            '<usernames xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-aaa-locald-cfg">'
+            '<username xc:operation="merge"><name>ansible1</name>'
+            "<secret><secret5>p1</secret5></secret></username></usernames>"
+            '<usernames xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-aaa-locald-cfg">'
+            '<username xc:operation="merge"><name>ansible2</name><secret/></username>'
+            "</usernames></aaa></config>",
+        )
+        self.assertEqual(
+            iosxr.build_xml("aaa", xmap=self.xmap, params=users[0], opcode="filter"),
+            '<filter type="subtree">'
+            '<aaa xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-aaa-lib-cfg">'
+            '<usernames xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-aaa-locald-cfg">'
+            "<username><name>ansible1</name></username></usernames></aaa></filter>",
+        )
+
+    def test_compile_xmap_cached(self):
+        builder = iosxr.compile_xmap(self.xmap, "merge")
+        self.assertIs(iosxr.compile_xmap(self.xmap, "merge"), builder)
+        self.assertEqual(len(builder.steps), 5)
+        self.assertEqual(len(iosxr.compile_xmap(self.xmap, "filter").steps), 3)
+
+        # a changed xmap is compiled again
+        self.xmap["a:name"] = {"xpath": "aaa/usernames/username/name", "operation": "edit"}
+        self.assertIsNot(iosxr.compile_xmap(self.xmap, "merge"), builder)
+
+
+@skipUnless(iosxr.HAS_XML, "lxml is required")
+class TestIosxrEtreeFind(TestCase):
+    def test_etree_find_parses_reply_once(self):
+        reply = config_reply(("Gi0/0/0/0", "a"), ("Gi0/0/0/1", "b"))
+        reply = reply.replace(' xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-ifmgr-cfg"', "")
+        with patch.object(iosxr.etree, "fromstring", wraps=iosxr.etree.fromstring) as fromstring:
+            self.assertEqual(iosxr.etree_find(reply, "description").text, "a")
+            names = iosxr.etree_findall(reply, " interface-name ")
+            self.assertEqual([ele.text for ele in names], ["Gi0/0/0/0", "Gi0/0/0/1"])
+            # elements are searched as they are
+            entry = iosxr.etree_findall(reply, "interface-configuration")[1]
+            self.assertEqual(iosxr.etree_find(entry, "description").text, "b")
+            self.assertIsNone(iosxr.etree_find(entry, "mtu"))
+        fromstring.assert_called_once()
+
+    def test_etree_parse_cache_size(self):
+        replies = ["<data><n>%d</n></data>" % idx for idx in range(iosxr._PARSED_REPLIES_SIZE + 1)]
+        trees = [iosxr.etree_parse(reply) for reply in replies]
+        self.assertIs(iosxr.etree_parse(replies[-1]), trees[-1])
+        self.assertNotIn(replies[0], iosxr._PARSED_REPLIES)
+        self.assertEqual(iosxr.etree_find(replies[0], "n").text, "0")
+        self.assertEqual(iosxr.etree_parse("not xml"), "not xml")
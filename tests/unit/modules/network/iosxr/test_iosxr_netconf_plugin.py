@@ -0,0 +1,92 @@
+#
+# (c) 2026, Ansible by Red Hat, inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+from unittest import TestCase, skipUnless
+from unittest.mock import MagicMock
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.netconf import (
+    remove_namespaces,
+)
+
+from ansible_collections.cisco.iosxr.plugins.netconf import iosxr
+
+
+INSTALL_REPLY = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<rpc-reply message-id="urn:uuid:1" xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">\n'
+    " <data>\n"
+    '  <install xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-spirit-install-instmgr-oper">\n'
+    "   <version><label>7.3.2</label><package><name>IOS-XR</name></package>"
+    "<hardware-info>cisco IOS-XRv 9000 () processor</hardware-info></version>\n"
+    "  </install>\n"
+    " </data>\n"
+    "</rpc-reply>"
+)
+
+HOSTNAME_REPLY = (
+    '<rpc-reply message-id="urn:uuid:2" xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">'
+    '<data><host-names xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-shellutil-cfg">'
+    "<host-name>xr01</host-name></host-names></data></rpc-reply>"
+)
+
+EDIT_REPLY = (
+    '<rpc-reply xmlns:xc="urn:ietf:params:xml:ns:netconf:base:1.0" '
+    'xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="3">'
+    '<data><a xmlns="urn:x" xmlns:y="urn:y" xc:operation="merge" y:k="v"> text <b>1</b> tail</a>'
+    "<!-- comment --></data></rpc-reply>"
+)
+
+
+@skipUnless(iosxr.HAS_NCCLIENT, "ncclient is required")
+class TestIosxrNetconfPlugin(TestCase):
+    def setUp(self):
+        self.connection = MagicMock()
+        self.netconf = iosxr.Netconf(self.connection)
+        self.manager = self.connection.manager
+
+    def test_parse_reply_removes_namespaces(self):
+        for reply in (INSTALL_REPLY, HOSTNAME_REPLY, EDIT_REPLY):
+            self.assertEqual(
+                iosxr.to_xml(iosxr.parse_reply(reply)),
+                remove_namespaces(reply.replace('<?xml version="1.0" encoding="UTF-8"?>', "")),
+            )
+        root = iosxr.parse_reply(MagicMock(xml=EDIT_REPLY))
+        self.assertEqual(root.find("data/a").attrib, {"operation": "merge", "k": "v"})
+
+    def test_iterparse_reply(self):
+        self.assertEqual(
+            [ele.text for ele in iosxr.iterparse_reply(INSTALL_REPLY, tag="name")],
+            ["IOS-XR"],
+        )
+        tags = [ele.tag for ele in iosxr.iterparse_reply(HOSTNAME_REPLY)]
+        self.assertEqual(tags, ["host-name", "host-names", "data", "rpc-reply"])
+
+    def test_get_remove_ns(self):
+        self.manager.get.return_value = MagicMock(xml=HOSTNAME_REPLY)
+        self.assertEqual(
+            self.netconf.get(filter="<filter/>", remove_ns=True),
+            remove_namespaces(HOSTNAME_REPLY),
+        )
+
+    def test_get_device_info(self):
+        self.manager.get.side_effect = [
+            MagicMock(xml=INSTALL_REPLY),
+            MagicMock(xml=HOSTNAME_REPLY),
+        ]
+        self.assertEqual(
+            self.netconf.get_device_info(),
+            {
+                "network_os": "iosxr",
+                "network_os_package": "IOS-XR",
+                "network_os_version": "7.3.2",
+                "network_os_model": "IOS-XRv 9000",
+                "network_os_hostname": "xr01",
+            },
+        )
@@ -0,0 +1,128 @@
+#
+# (c) 2026, Ansible by Red Hat, inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import re
+
+from textwrap import dedent
+from unittest import TestCase
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.rm_base.network_template import (
+    NetworkTemplate as BaseNetworkTemplate,
+)
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    dict_merge,
+)
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.bgp_global import (
+    Bgp_globalTemplate,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.logging_global import (
+    Logging_globalTemplate,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.network_template import (
+    EXACT,
+    PREFIX,
+    WILDCARD,
+    Template,
+    get_dispatch_index,
+    merge_into,
+    parser_keys,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    get_bgp_config,
+)
+
+
+class TestIosxrNetworkTemplate(TestCase):
+    def test_parser_keys(self):
+        self.assertEqual(
+            parser_keys(re.compile(r"^router\sbgp\s(?P<as_num>\S+)$")),
+            {(EXACT, "router")},
+        )
+        self.assertEqual(
+            parser_keys(
+                re.compile(
+                    r"""
+                    (\s+vrf\s(?P<vrf>\S+))?
+                    \s+address-family\s(?P<afi>\S+)
+                    """,
+                    re.VERBOSE,
+                ),
+            ),
+            {(EXACT, "vrf"), (EXACT, "address")},
+        )
+        self.assertEqual(
+            parser_keys(re.compile(r"(?P<afi>^(ipv4|ipv6))\sprefix-list")),
+            {(EXACT, "ipv4"), (EXACT, "ipv6")},
+        )
+        self.assertEqual(parser_keys(re.compile(r"\s+neighbor\S+")), {(PREFIX, "neighbor")})
+        self.assertIs(parser_keys(re.compile(r"\s(?P<sequence>\d+)\sremark")), WILDCARD)
+        self.assertIs(parser_keys(re.compile(r"^router", re.IGNORECASE)), WILDCARD)
+
+    def test_dispatch_candidates(self):
+        tmplt = Bgp_globalTemplate()
+        index = get_dispatch_index(tmplt)
+        self.assertIs(index, get_dispatch_index(Bgp_globalTemplate()))
+        self.assertEqual(
+            [parser["name"] for parser in index.candidates("router bgp 65536")],
+            ["router"],
+        )
+        self.assertEqual(index.candidates(" !"), ())
+
+    def test_parse_matches_netcommon(self):
+        config = dedent(
+            """\
+            router bgp 65536
+             bgp router-id 192.0.2.1
+             bgp confederation identifier 4
+             neighbor 192.0.2.2
+              remote-as 65537
+              description peer 1
+              update-source Loopback0
+             !
+             vrf vrf1
+              rd auto
+              neighbor 192.0.2.3
+               remote-as 65538
+              !
+             !
+            !
+            """,
+        )
+        tmplt = Bgp_globalTemplate(lines=get_bgp_config(config).global_lines)
+        self.assertEqual(tmplt.parse(), BaseNetworkTemplate.parse(tmplt))
+
+    def test_merge_into(self):
+        base = {"a": {"b": 1, "c": [1, 2]}, "d": "x", "e": None}
+        other = {"a": {"b": 2, "c": [2, 3], "f": {"g": 1}}, "d": None, "h": "y"}
+        expected = dict_merge(base, other)
+        self.assertEqual(merge_into(base, other), expected)
+
+    def test_render_matches_netcommon(self):
+        tmplt = Logging_globalTemplate()
+        base = BaseNetworkTemplate(tmplt=Logging_globalTemplate())
+        data = {"archive": {"device": "disk0", "severity": "errors"}, "hostnameprefix": "test"}
+        for parser in ("archive.device", "archive.severity", "hostnameprefix", "files"):
+            for negate in (False, True):
+                self.assertEqual(
+                    tmplt.render(data, parser, negate),
+                    base.render(data, parser, negate),
+                )
+        with self.assertRaises(IndexError):
+            tmplt.render(data, "no_such_parser")
+
+    def test_template_compiled_once(self):
+        template = Template()
+        self.assertIs(template.env, Template().env)
+        value = "logging {{ name }}"
+        self.assertIs(template.compile(value), template.compile(value))
+        self.assertEqual(template(value, {"name": "on"}), "logging on")
+        self.assertIsNone(template(value, {}, fail_on_undefined=False))
+        self.assertEqual(template("{{ 1 + 1 }}"), 2)
@@ -391,6 +391,47 @@ class TestIosxrPrefixListsModule(TestIosxrModule):
 
         self.assertEqual(parsed_list, result["parsed"])
 
+    def test_iosxr_prefix_list_parsed_full_config(self):
+        set_module_args(
+            dict(
+                running_config=dedent(
+                    """\
+                    hostname iosxr01
+                    ipv4 access-list acl_1
+                     10 permit ipv4 any any
+                    !
+                    ipv4 prefix-list test1
+                     3 remark test1
+                    !
+                    ipv6 access-list acl_2
+                     20 deny ipv6 any any
+                    !
+                    """,
+                ),
+                state="parsed",
+            ),
+        )
+        result = self.execute_module(changed=False)
+        parsed_list = [
+            {
+                "afi": "ipv4",
+                "prefix_lists": [
+                    {
+                        "name": "test1",
+                        "entries": [
+                            {
+                                "sequence": 3,
+                                "action": "remark",
+                                "description": "test1",
+                            },
+                        ],
+                    },
+                ],
+            },
+        ]
+
+        self.assertEqual(parsed_list, result["parsed"])
+
     def test_iosxr_prefix_list_overridden(self):
         run_cfg = dedent(
             """ipv6 prefix-list test2\n 4 remark test\n!
@@ -45,30 +45,18 @@ class TestIosxrRouteMapsModule(TestIosxrModule):
 
         self.mock_get_config = patch(
             "ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.route_maps.route_maps."
-            "Route_mapsFacts.get_policynames",
+            "Route_mapsFacts.get_config",
         )
         self.get_config = self.mock_get_config.start()
 
-        self.mock_get_config_data = patch(
-            "ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.route_maps.route_maps."
-            "Route_mapsFacts.get_policydata",
-        )
-        self.get_config_data = self.mock_get_config_data.start()
-
     def tearDown(self):
         super(TestIosxrRouteMapsModule, self).tearDown()
         self.get_resource_connection.stop()
         self.get_config.stop()
-        self.get_config_data.stop()
 
     def test_iosxr_route_maps_merged_simple(self):
         self.maxDiff = None
         self.get_config.return_value = dedent(
-            """\
-            route-policy TEST_ROUTE_POLICY_COMPLEX
-            """,
-        )
-        self.get_config_data.return_value = dedent(
             """\
             route-policy TEST_ROUTE_POLICY_COMPLEX
               set ospf-metric 232
@@ -242,11 +230,6 @@ class TestIosxrRouteMapsModule(TestIosxrModule):
     def test_iosxr_route_maps_merged_complex(self):
         self.maxDiff = None
         self.get_config.return_value = dedent(
-            """\
-            route-policy TEST_ROUTE_POLICY_COMPLEX
-            """,
-        )
-        self.get_config_data.return_value = dedent(
             """\
             route-policy TEST_ROUTE_POLICY_COMPLEX
               set ospf-metric 232
@@ -446,7 +429,6 @@ class TestIosxrRouteMapsModule(TestIosxrModule):
 
     def test_set_med_and_extcommunity(self):
         self.get_config.return_value = "route-policy TEST-MED-EXTCOMM"
-        self.get_config_data.return_value = ""
         set_module_args(
             dict(
                 config=[
@@ -478,11 +460,6 @@ class TestIosxrRouteMapsModule(TestIosxrModule):
     def test_iosxr_route_maps_overridden(self):
         self.maxDiff = None
         self.get_config.return_value = dedent(
-            """\
-            route-policy TEST_ROUTE_POLICY_COMPLEX
-            """,
-        )
-        self.get_config_data.return_value = dedent(
             """\
             route-policy TEST_ROUTE_POLICY_COMPLEX
               set ospf-metric 232
@@ -684,11 +661,6 @@ class TestIosxrRouteMapsModule(TestIosxrModule):
     def test_iosxr_route_maps_replaced(self):
         self.maxDiff = None
         self.get_config.return_value = dedent(
-            """\
-            route-policy TEST_ROUTE_POLICY_COMPLEX
-            """,
-        )
-        self.get_config_data.return_value = dedent(
             """\
             route-policy TEST_ROUTE_POLICY_COMPLEX
               set ospf-metric 232
@@ -886,11 +858,6 @@ class TestIosxrRouteMapsModule(TestIosxrModule):
     def test_iosxr_route_maps_purged_safe(self):
         self.maxDiff = None
         self.get_config.return_value = dedent(
-            """\
-            route-policy TEST_ROUTE_POLICY_COMPLEX
-            """,
-        )
-        self.get_config_data.return_value = dedent(
             """\
             route-policy TEST_ROUTE_POLICY_COMPLEX
               set ospf-metric 232
@@ -1038,11 +1005,6 @@ class TestIosxrRouteMapsModule(TestIosxrModule):
     def test_iosxr_route_maps_purged(self):
         self.maxDiff = None
         self.get_config.return_value = dedent(
-            """\
-            route-policy APPLY_TEST_ROUTE_POLICY_COMPLEX
-            """,
-        )
-        self.get_config_data.return_value = dedent(
             """\
             route-policy APPLY_TEST_ROUTE_POLICY_COMPLEX
               set ospf-metric 232
@@ -1353,11 +1315,6 @@ class TestIosxrRouteMapsModule(TestIosxrModule):
             route-policy TEST_ROUTE_POLICY_COMPLEX
             """,
         )
-        self.get_config_data.return_value = dedent(
-            """\
-            route-policy TEST_ROUTE_POLICY_COMPLEX
-            """,
-        )
         set_module_args(
             dict(
                 config=[
@@ -1429,11 +1386,6 @@ class TestIosxrRouteMapsModule(TestIosxrModule):
     def test_iosxr_routemap_multiple_params_gathered(self):
         self.maxDiff = None
         self.get_config.return_value = dedent(
-            """\
-            route-policy TEST_POLICY_TWO_PARAMS($SPECIFICITY, $GEO_LOCATION)
-            """,
-        )
-        self.get_config_data.return_value = dedent(
             """\
             route-policy TEST_POLICY_TWO_PARAMS($SPECIFICITY, $GEO_LOCATION)
                set community (64496:100, 64496:$SPECIFICITY, 64496:$GEO_LOCATION, 65012:174)
@@ -1457,3 +1409,37 @@ class TestIosxrRouteMapsModule(TestIosxrModule):
         ]
         result = self.execute_module(changed=False)
         self.assertEqual(sorted(gathered), sorted(result["gathered"]))
+
+    def test_iosxr_route_maps_gathered_multiple(self):
+        self.maxDiff = None
+        self.get_config.return_value = dedent(
+            """\
+            route-policy POLICY_ONE
+              set local-preference 150
+            end-policy
+            !
+            route-policy POLICY_TWO
+              if destination in DEFAULT then
+                set weight 23
+              endif
+            end-policy
+            !
+            """,
+        )
+        set_module_args(dict(state="gathered"))
+        gathered = [
+            {
+                "name": "POLICY_ONE",
+                "global": {"set": {"local_preference": [{"metric_number": 150}]}},
+            },
+            {
+                "name": "POLICY_TWO",
+                "if_section": {
+                    "condition": "destination in DEFAULT",
+                    "set": {"weight": 23},
+                },
+            },
+        ]
+        result = self.execute_module(changed=False)
+        self.assertEqual(gathered, result["gathered"])
+        self.assertEqual(self.get_config.call_count, 1)
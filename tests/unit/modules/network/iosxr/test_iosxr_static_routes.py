@@ -577,3 +577,37 @@ class TestIosxrStaticRoutesModule(TestIosxrModule):
             "no 2001:db8:1000::/36 FastEthernet0/0/0/7",
         ]
         self.execute_module(changed=True, commands=commands)
+
+    def test_iosxr_static_routes_parsed_overlapping_dest(self):
+        set_module_args(
+            dict(
+                running_config="router static\n address-family ipv4 unicast\n  10.0.0.0/8 Null0\n  "
+                "110.0.0.0/8 192.0.2.1\n  10.0.0.0/8 192.0.2.2 tag 10\n !\n!",
+                state="parsed",
+            ),
+        )
+        result = self.execute_module(changed=False)
+        parsed_list = [
+            {
+                "address_families": [
+                    {
+                        "afi": "ipv4",
+                        "routes": [
+                            {
+                                "dest": "10.0.0.0/8",
+                                "next_hops": [
+                                    {"interface": "Null0"},
+                                    {"forward_router_address": "192.0.2.2", "tag": 10},
+                                ],
+                            },
+                            {
+                                "dest": "110.0.0.0/8",
+                                "next_hops": [{"forward_router_address": "192.0.2.1"}],
+                            },
+                        ],
+                        "safi": "unicast",
+                    },
+                ],
+            },
+        ]
+        self.assertEqual(parsed_list, result["parsed"])
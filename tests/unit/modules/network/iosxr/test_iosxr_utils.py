@@ -8,9 +8,23 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from copy import deepcopy
 from unittest import TestCase
 
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import Version
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    remove_empties,
+)
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    FactSkeleton,
+    Version,
+    flatten_config,
+    get_bgp_config,
+    get_config_section,
+    get_interface_sections,
+    index_obj_in_list,
+    split_config_sections,
+)
 
 
 class TestIosxrUtils(TestCase):
@@ -28,3 +42,166 @@ class TestIosxrUtils(TestCase):
         self.assertEqual(Version("4.0.1") > Version("3.0.1"), True)
         self.assertEqual(Version("4.1.1") > Version("4.1.0"), True)
         self.assertEqual(Version("4.1.1") == Version("4.1.1"), True)
+
+    def test_split_config_sections(self):
+        config = "\n".join(
+            [
+                "!! IOS XR Configuration 7.0.2",
+                "hostname xr01",
+                "router ospf 1",
+                " area 0",
+                " !",
+                "!",
+                "router ospfv3 1",
+                "!",
+                "route-policy pass",
+                "  pass",
+                "end-policy",
+                "!",
+                "end",
+            ],
+        )
+        sections = split_config_sections(config)
+        self.assertEqual(
+            [header for header, section in sections],
+            ["hostname xr01", "router ospf 1", "router ospfv3 1", "route-policy pass"],
+        )
+        self.assertEqual(
+            get_config_section(sections, ["router ospf"]),
+            "router ospf 1\n area 0\n !\n!",
+        )
+        self.assertEqual(
+            get_config_section(sections, ["route-policy", "hostname"]),
+            "hostname xr01\nroute-policy pass\n  pass\nend-policy\n!",
+        )
+        self.assertEqual(get_config_section(sections, ["lldp"]), "")
+
+    def test_bgp_config(self):
+        config = "\n".join(
+            [
+                "router bgp 65536",
+                " bgp router-id 192.0.2.1",
+                " address-family ipv4 unicast",
+                " !",
+                " neighbor-group NG1",
+                "  remote-as 65537",
+                " !",
+                " neighbor 192.0.2.2",
+                "  use neighbor-group NG1",
+                "  address-family ipv4 unicast",
+                "  !",
+                " !",
+                "!",
+            ],
+        )
+        bgp_config = get_bgp_config(config)
+        self.assertIs(bgp_config, get_bgp_config(config))
+        self.assertEqual(
+            bgp_config.global_lines,
+            [
+                "router bgp 65536",
+                " bgp router-id 192.0.2.1",
+                " neighbor-group NG1",
+                " neighbor-group NG1 remote-as 65537",
+                " !",
+                " neighbor 192.0.2.2",
+                " neighbor 192.0.2.2 use neighbor-group NG1",
+                " !",
+                "!",
+            ],
+        )
+        self.assertEqual(
+            bgp_config.template_lines,
+            [
+                "router bgp 65536",
+                " neighbor-group NG1",
+                " neighbor-group NG1 remote-as 65537",
+                " !",
+                "!",
+            ],
+        )
+        self.assertIn(
+            " neighbor 192.0.2.2 address-family ipv4 unicast",
+            bgp_config.address_family_lines,
+        )
+
+    def test_interface_sections(self):
+        config = "\n".join(
+            [
+                "interface Bundle-Ether10",
+                " description Bundle",
+                "!",
+                "interface preconfigure GigabitEthernet0/0/0/1",
+                " bundle id 10 mode active",
+                "!",
+            ],
+        )
+        sections = get_interface_sections(config)
+        self.assertIs(sections, get_interface_sections(config))
+        self.assertEqual(
+            list(sections),
+            [
+                "",
+                "Bundle-Ether10\n description Bundle\n!",
+                "preconfigure GigabitEthernet0/0/0/1\n bundle id 10 mode active\n!",
+            ],
+        )
+        self.assertEqual(sections.lines[0], "interface Bundle-Ether10")
+
+    def test_flatten_config_contexts(self):
+        config = "\n".join(
+            [
+                "vrf vrf1",
+                " address-family ipv4 unicast",
+                "  import route-target",
+                "   64501:1",
+                "  !",
+                "  export route-policy rp1",
+                " !",
+                "!",
+            ],
+        )
+        flattened = config
+        for context in ["export", "import", "address-family", "vrf"]:
+            flattened = flatten_config(flattened, context)
+        self.assertEqual(
+            flatten_config(config, ["export", "import", "address-family", "vrf"]),
+            flattened,
+        )
+        self.assertEqual(
+            flattened.splitlines()[3],
+            "vrf vrf1 address-family ipv4 unicast import route-target 64501:1",
+        )
+
+    def test_index_obj_in_list(self):
+        aces = [{"sequence": 10, "grant": "permit"}, {"sequence": 20}, {"sequence": 10}]
+        index = index_obj_in_list(aces, key="sequence")
+        self.assertIs(index[10], aces[0])
+        self.assertIs(index[20], aces[1])
+        self.assertIsNone(index.get(30))
+        self.assertEqual(index_obj_in_list(None), {})
+
+    def test_fact_skeleton(self):
+        spec = {
+            "name": None,
+            "links": {"max_active": None, "min_active": None},
+            "mode": None,
+            "members": None,
+        }
+        skeleton, copied = FactSkeleton(spec), deepcopy(spec)
+        for config in (skeleton, copied):
+            config["mode"] = "active"
+            config["links"]["min_active"] = 2
+            config["links"]["max_active"] = 4
+            config["name"] = "Bundle-Ether10"
+        self.assertNotIn("members", skeleton)
+        self.assertEqual(
+            list(skeleton.remove_empties().items()),
+            list(remove_empties(copied).items()),
+        )
+        self.assertEqual(
+            list(skeleton.remove_empties()["links"]),
+            ["max_active", "min_active"],
+        )
+        self.assertEqual(FactSkeleton(spec).remove_empties(), {})
+        self.assertEqual(spec["links"], {"max_active": None, "min_active": None})
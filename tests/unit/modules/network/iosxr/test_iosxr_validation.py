@@ -0,0 +1,95 @@
+#
+# (c) 2026, Ansible by Red Hat, inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import json
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
+    validate_config as netcommon_validate_config,
+)
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.acls.acls import (
+    AclsArgs,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.l3_interfaces.l3_interfaces import (
+    L3_InterfacesArgs,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils import validation
+
+
+class TestIosxrValidation(TestCase):
+    def assertSameValidation(self, spec, data):
+        result = validation.validate_config(spec, data)
+        # key order is part of the facts output
+        self.assertEqual(
+            json.dumps(result),
+            json.dumps(netcommon_validate_config(spec, data)),
+        )
+        return result
+
+    def test_validate_config_matches_netcommon(self):
+        data = {
+            "config": [
+                {
+                    "name": "GigabitEthernet0/0/0/0",
+                    "ipv4": [{"address": "192.0.2.1/24"}],
+                    "ipv6": [{"address": "2001:db8::1/64"}],
+                },
+            ],
+        }
+        result = self.assertSameValidation(L3_InterfacesArgs.argument_spec, data)
+        self.assertIsNot(result["config"][0]["ipv4"], data["config"][0]["ipv4"])
+
+        data = {
+            "config": [
+                {
+                    "afi": "ipv4",
+                    "acls": [
+                        {
+                            "name": "acl_1",
+                            "aces": [
+                                {
+                                    "sequence": "10",
+                                    "grant": "permit",
+                                    "protocol": "tcp",
+                                    "source": {"any": "yes"},
+                                    "destination": {"host": "192.0.2.2"},
+                                },
+                            ],
+                        },
+                    ],
+                },
+            ],
+        }
+        result = self.assertSameValidation(AclsArgs.argument_spec, data)
+        ace = result["config"][0]["acls"][0]["aces"][0]
+        self.assertEqual(ace["sequence"], 10)
+        self.assertIs(ace["source"]["any"], True)
+
+    def test_validate_config_fallback(self):
+        spec = L3_InterfacesArgs.argument_spec
+        unknown = {"config": [{"name": "GigabitEthernet0/0/0/0", "mtu": 1500}]}
+        invalid = {"config": [{"name": "GigabitEthernet0/0/0/0", "ipv4": "192.0.2.1/24"}]}
+        choices = {"state": "present"}
+        with patch.object(validation, "_validate_config", return_value="netcommon") as full:
+            for data in (unknown, invalid, choices):
+                self.assertEqual(validation.validate_config(spec, data), "netcommon")
+            self.assertEqual(full.call_count, 3)
+
+            spec = {"config": {"type": "str", "fallback": (str, ["x"])}}
+            self.assertIsNone(validation.compile_spec(spec))
+            self.assertEqual(validation.validate_config(spec, {"config": "x"}), "netcommon")
+
+    def test_has_no_log(self):
+        self.assertFalse(validation.has_no_log(L3_InterfacesArgs.argument_spec))
+        spec = {"config": {"type": "dict", "options": {"key": {"type": "str", "no_log": True}}}}
+        self.assertTrue(validation.has_no_log(spec))
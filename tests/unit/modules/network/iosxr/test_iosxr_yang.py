@@ -0,0 +1,116 @@
+#
+# (c) 2026, Ansible by Red Hat, inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+from __future__ import absolute_import, division, print_function
+
+
+__metaclass__ = type
+
+import json
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from ansible.module_utils.connection import ConnectionError
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.interfaces.interfaces import (
+    InterfacesFacts,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.static_routes.static_routes import (
+    Static_routesFacts,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils import yang
+
+from .iosxr_module import load_fixture
+
+
+class TestIosxrYangFacts(TestCase):
+    def assertSameFacts(self, facts_cls, cli_fixture, yang_fixture):
+        cli_facts = {"ansible_network_resources": {}}
+        facts_cls(MagicMock()).populate_facts(None, cli_facts, load_fixture(cli_fixture))
+        yang_facts = {"ansible_network_resources": {}}
+        facts_cls(MagicMock()).populate_yang_facts(None, yang_facts, load_fixture(yang_fixture))
+        self.assertTrue(cli_facts["ansible_network_resources"])
+        self.assertEqual(yang_facts, cli_facts)
+
+    def test_iosxr_yang_interfaces(self):
+        self.assertSameFacts(
+            InterfacesFacts,
+            "iosxr_interface_config.cfg",
+            "iosxr_interface_config_yang.json",
+        )
+
+    def test_iosxr_yang_static_routes(self):
+        self.assertSameFacts(
+            Static_routesFacts,
+            "iosxr_static_routes_config.cfg",
+            "iosxr_static_routes_config_yang.json",
+        )
+
+    def test_iosxr_yang_static_routes_leaves(self):
+        def next_hop(**leaves):
+            leaves["next-hop-address"] = "192.0.2.1"
+            return {
+                "Cisco-IOS-XR-ip-static-cfg:router-static": {
+                    "default-vrf": {
+                        "address-family": {
+                            "vrfipv4": {
+                                "vrf-unicast": {
+                                    "vrf-prefixes": {
+                                        "vrf-prefix": [
+                                            {
+                                                "prefix": "198.51.100.0",
+                                                "prefix-length": 24,
+                                                "vrf-route": {
+                                                    "vrf-next-hop-table": {
+                                                        "vrf-next-hop-next-hop-address": [leaves],
+                                                    },
+                                                },
+                                            },
+                                        ],
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            }
+
+        def facts(data):
+            facts = {"ansible_network_resources": {}}
+            Static_routesFacts(MagicMock()).populate_yang_facts(None, facts, data)
+            routes = facts["ansible_network_resources"]["static_routes"]
+            return routes[0]["address_families"][0]["routes"][0]["next_hops"][0]
+
+        # the distance metric is the admin distance, load-metric the metric keyword
+        self.assertEqual(
+            facts(next_hop(**{"metric": 10, "load-metric": 20, "permanent": [None]})),
+            {"forward_router_address": "192.0.2.1", "admin_distance": 10, "metric": 20},
+        )
+        with self.assertRaisesRegex(ValueError, "unsupported YANG leaves .*: index"):
+            facts(next_hop(index="1"))
+
+    def test_iosxr_yang_get_config(self):
+        connection = MagicMock()
+        connection.get_config.return_value = {"response": "", "error": ""}
+        facts = {"ansible_network_resources": {}}
+        Static_routesFacts(MagicMock()).populate_yang_facts(connection, facts)
+        self.assertEqual(facts["ansible_network_resources"], {"static_routes": []})
+        connection.get_config.assert_called_once_with(
+            section='{"Cisco-IOS-XR-ip-static-cfg:router-static": [null]}',
+        )
+
+        connection.get_config.return_value = {"response": "", "error": "permission denied"}
+        with self.assertRaises(ConnectionError):
+            InterfacesFacts(MagicMock()).populate_yang_facts(connection, facts)
+
+    def test_iosxr_yang_helpers(self):
+        data = json.loads('{"a": {"b": [{"c": 1}], "d": [null]}}')
+        self.assertEqual(yang.yang_list(data, "a", "b"), [{"c": 1}])
+        self.assertEqual(yang.yang_list(data, "a", "x", "y"), [])
+        self.assertIsNone(yang.yang_get(data, "a", "b", "c"))
+        yang.check_yang_leaves(data["a"], ("b", "d"), "a")
+        with self.assertRaisesRegex(ValueError, "unsupported YANG leaves in a: d"):
+            yang.check_yang_leaves(data["a"], ("b",), "a")